@@ -5,8 +5,10 @@
 import sys
 from importlib.metadata import PackageNotFoundError, version  # pragma: no cover
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from omegaconf import DictConfig, OmegaConf
+if TYPE_CHECKING:
+    from omegaconf import DictConfig
 
 try:
     # Change here if project is renamed and does not equal the package name
@@ -26,12 +28,28 @@ def _parent(path: str) -> Path:
     return Path(path).parent
 
 
-def _subfield(node: DictConfig, field: str):
+def _subfield(node: "DictConfig", field: str):
     return node[field]
 
 
-OmegaConf.register_new_resolver("subfield", _subfield)
-OmegaConf.register_new_resolver("root", lambda path: f"{_resolve_root() / path}")
-OmegaConf.register_new_resolver("parent", lambda path: f"{_parent(path)}")
+_resolvers_registered = False
+
+
+def register_config_resolvers() -> None:
+    """Register the package-level OmegaConf resolvers used in the configs under
+    `aspera.configs`. `omegaconf` is only imported when this is first called (by
+    `aspera.utils` and `aspera.readers`, which the config-driven endpoints import),
+    so that code which does not load configs (eg the sandbox executing agent
+    programs) does not pay for it. Calling this more than once has no effect."""
+    global _resolvers_registered
+    if _resolvers_registered:
+        return
+    from omegaconf import OmegaConf
+
+    OmegaConf.register_new_resolver("subfield", _subfield)
+    OmegaConf.register_new_resolver("root", lambda path: f"{_resolve_root() / path}")
+    OmegaConf.register_new_resolver("parent", lambda path: f"{_parent(path)}")
+    _resolvers_registered = True
+
 
 sys.path.append(str(_resolve_root()))
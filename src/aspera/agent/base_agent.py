@@ -2,19 +2,20 @@
 # For licensing see accompanying LICENSE file.
 # Copyright © 2025 Apple Inc. All Rights Reserved.
 #
+import ast
+import functools
 import logging
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from pathlib import Path
 from typing import Any, Iterator
 
-from aspera.aliases import ExamplesModule
+from aspera.aliases import ExamplesModule, ProgramStr
 from aspera.code_utils.code_symbol import CodeSymbol
 from aspera.code_utils.utils import (
     _has_aspera_filenames,
+    _is_import_tree,
     escape_program_str,
-    is_import,
-    remove_import_statements,
+    remove_aspera_imports,
 )
 from aspera.completer import CompleterType
 from aspera.completer.utils import ChatMessage, LLMPrompt
@@ -22,7 +23,12 @@ from aspera.constants import DOCS_ROOT, IMPLEMENTATIONS_ROOT, PACKAGE_NAME
 from aspera.dataset_schema import DataPoint
 from aspera.evaluator import EvaluationResult, Evaluator, Solution, solution_correct
 from aspera.execution_evaluation_tools_implementation.exceptions import SolutionError
-from aspera.parser import DUMMY_PLACEHOLDER_BAD_SOLUTION, ParserType, ProgramFinderError
+from aspera.parser import (
+    DUMMY_PLACEHOLDER_BAD_SOLUTION,
+    ExtractFunctionReturnType,
+    ParserType,
+    ProgramFinderError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +40,12 @@ GuidelineType = str
 # see src/aspera/scenario.py::Guideline for types
 
 
+@functools.lru_cache(maxsize=None)
+def _return_type(program: ProgramStr) -> str:
+    """The return type of the ground truth `program`, which is shown to the agent."""
+    return ExtractFunctionReturnType()(program)
+
+
 class BaseAgent(ABC):
     def __init__(
         self,
@@ -60,6 +72,9 @@ class BaseAgent(ABC):
             assert format_examples_module is not None, ZS_ASSERTION
         self._single_shot = single_shot
         self._format_examples_module = format_examples_module
+        # scores computed since the last solution was submitted, keyed by
+        # whether they are import-lenient
+        self._scores: dict[bool, float] = {}
 
     @property
     def name(self) -> str:
@@ -75,6 +90,7 @@ class BaseAgent(ABC):
 
     def submit_solution(self, query: DataPoint, solution: Solution) -> EvaluationResult:
         """Submit solution to the evaluator."""
+        self._scores.clear()
         try:
             feedback = self.evaluator.get_solution_feedback(solution)
         except (SolutionError, AssertionError):
@@ -94,8 +110,9 @@ class BaseAgent(ABC):
             and solution.program_no_imports
         ):
             self._bad_import_queries.add(query.query_id)
-            solution_no_imports = deepcopy(solution)
-            solution_no_imports.program = solution.program_no_imports
+            solution_no_imports = solution.model_copy(
+                update={"program": solution.program_no_imports}
+            )
             try:
                 import_lenient_feedback = self.evaluator.get_solution_feedback(
                     solution_no_imports, import_lenient=True
@@ -122,13 +139,22 @@ class BaseAgent(ABC):
             ),
         )
 
+    def _get_score(self, import_lenient: bool = False) -> float:
+        """The evaluator aggregates the results of all the queries to compute the
+        score, so it is only recomputed after a new solution is submitted."""
+        if import_lenient not in self._scores:
+            self._scores[import_lenient] = self.evaluator.get_score(
+                import_lenient=import_lenient
+            )
+        return self._scores[import_lenient]
+
     @property
     def score(self) -> float:
-        return self.evaluator.get_score()
+        return self._get_score()
 
     @property
     def import_lenient_score(self) -> float:
-        return self.evaluator.get_score(import_lenient=True)
+        return self._get_score(import_lenient=True)
 
     @property
     def solution_err_rate(self) -> float:
@@ -223,8 +249,8 @@ class BaseAgent(ABC):
             parsed = self._parser.parse(completion)
         except ProgramFinderError:
             # Agent failed to produce valid Python; return this so it fails in a traceable way
-            logger.warning(f"Query {query.query_id}: {query.query}")
-            logger.warning(f"Failed to parse completion: {completion}")
+            logger.warning("Query %s: %s", query.query_id, query.query)
+            logger.warning("Failed to parse completion: %s", completion)
             self._parsing_failure_cnt += 1
             return Solution(
                 raw_completion=completion,
@@ -233,32 +259,32 @@ class BaseAgent(ABC):
                 prompt=llm_prompt,
                 primitives_selection_symbols=tr_code_symbols,
             )
+        # each program is parsed once, and the tree of the solution is reused
+        # below to remove the model-issued aspera imports
         programs = []
         for program in parsed:
-            if is_import(program):
+            tree = ast.parse(program)
+            if program and _is_import_tree(tree):
                 imports.append(f"{program}\n")
             else:
-                programs.append(program)
+                programs.append((program, tree))
 
-        imports_list = list(dict.fromkeys(imports))
-        imports_str = "".join(imports_list).strip()
-        program_str = escape_program_str(programs.pop())
-        try:
-            # Remove model-issued imports at the top level
-            filtered_imports_list = []
-            for im in imports_list:
-                if _has_aspera_filenames(im) and "*" not in im:
-                    continue
+        # dedup the imports and drop model-issued aspera imports in one pass
+        seen, imports_list, filtered_imports_list = set(), [], []
+        for im in imports:
+            if im in seen:
+                continue
+            seen.add(im)
+            imports_list.append(im)
+            if not _has_aspera_filenames(im) or "*" in im:
                 filtered_imports_list.append(im)
-            filtered_imports_str = "".join(filtered_imports_list).strip()
-            program_str_no_imports = remove_import_statements(
-                program_str,
-                package_name=None,
-                global_only=False,
-                remove_aspera_imports_only=True,
-            )
-        except SyntaxError:
-            filtered_imports_str, program_str_no_imports = None, None
+        imports_str = "".join(imports_list).strip()
+        filtered_imports_str = "".join(filtered_imports_list).strip()
+        program, tree = programs.pop()
+        program_str = escape_program_str(program)
+        # Remove model-issued imports. Escaping does not change
+        # the line structure, so the tree of the unescaped program can be used.
+        program_str_no_imports = remove_aspera_imports(program_str, tree=tree)
         return Solution(
             raw_completion=completion,
             query=query.query,
@@ -6,14 +6,14 @@ import logging
 from pathlib import Path
 from typing import Any, Callable
 
-from aspera.agent.base_agent import BaseAgent
+from aspera.agent.base_agent import BaseAgent, _return_type
 from aspera.aliases import ExamplesModule
 from aspera.code_utils.code_symbol import CodeSymbol
 from aspera.code_utils.utils import get_imports
 from aspera.completer import CompleterType
 from aspera.completer.utils import ChatMessage
 from aspera.dataset_schema import DataPoint
-from aspera.parser import ExtractFunctionReturnType, ParserType
+from aspera.parser import ParserType
 from aspera.prompting.system_turn_prompts import SystemTurnTemplate
 from aspera.prompting.user_turn_prompts import UserTurnTemplate
 
@@ -60,7 +60,7 @@ class CompleteCodebaseKnowledgeAgent(BaseAgent):
             UserTurnTemplate(template_factory=self._user_template).get_prompt(
                 {
                     "queries": [query.query],
-                    "return_type": ExtractFunctionReturnType()(annotation.program),
+                    "return_type": _return_type(annotation.program),
                 }
             ),
         ]
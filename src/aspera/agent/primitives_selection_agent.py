@@ -2,17 +2,20 @@
 # For licensing see accompanying LICENSE file.
 # Copyright © 2025 Apple Inc. All Rights Reserved.
 #
+import functools
+import heapq
 import logging
-from copy import deepcopy
+from operator import attrgetter
 from pathlib import Path
 from typing import Callable
 
 from aspera import apps
-from aspera.agent.base_agent import BaseAgent, GuidelineType
+from aspera.agent.base_agent import BaseAgent, GuidelineType, _return_type
 from aspera.aliases import AppName, ExamplesModule
 from aspera.code_utils.code_symbol import CodeSymbol, dedup_and_sort_symbols
 from aspera.code_utils.utils import (
     get_apps_symbols_from_program,
+    get_apps_symbols_from_programs,
     get_imports,
     get_source_code_for_apps,
     make_prompt_code_string,
@@ -22,7 +25,7 @@ from aspera.completer import CompleterType
 from aspera.completer.utils import ChatMessage, LLMPrompt, MessageList
 from aspera.constants import APP_DOCS_ROOT, EXAMPLES_ROOT
 from aspera.dataset_schema import DataPoint
-from aspera.parser import ExtractFunctionReturnType, ParserType, ProgramFinderError
+from aspera.parser import ParserType, ProgramFinderError
 from aspera.prompting.primitives_selection_prompts import (
     PrimitivesSelectionTemplate,
     UserTurnPrimitivesSelectionTemplate,
@@ -33,7 +36,17 @@ from aspera.prompting.user_turn_prompts import UserTurnTemplate
 logger = logging.getLogger(__name__)
 
 # These are stubs or irrelevant, so we can ignore them to save tokens
-APP_DENY_LIST = ["reminders"]
+APP_DENY_LIST: frozenset[str] = frozenset({"reminders"})
+
+
+@functools.lru_cache(maxsize=None)
+def _prompt_code_for_app(app: AppName) -> str:
+    """The source of `app` as shown in primitives selection prompts. This does
+    not depend on the query, so it is only computed once per app."""
+    return make_prompt_code_string(
+        app,
+        remove_import_statements(get_source_code_for_apps([app]).pop()),
+    )
 
 
 class PrimitivesSelectionAgent(BaseAgent):
@@ -47,6 +60,9 @@ class PrimitivesSelectionAgent(BaseAgent):
         to be accounted for when generating execution plans
     primitives_selection_guidelines
         Subset of the above, containing guidelines that could influence tool selection.
+    max_workers
+        How many per-app primitives selection requests are sent to the completer
+        concurrently. The selections for different apps are independent.
     """
 
     def __init__(
@@ -61,6 +77,7 @@ class PrimitivesSelectionAgent(BaseAgent):
         primitives_selection_guidelines: dict[str, list[str]] | None = None,
         single_shot: bool = False,
         format_examples_module: ExamplesModule | None = None,
+        max_workers: int = 1,
         **kwargs,
     ):
         super().__init__(
@@ -78,36 +95,43 @@ class PrimitivesSelectionAgent(BaseAgent):
         self._primitives_selection_guidelines: dict[GuidelineType, list[str]] = (
             primitives_selection_guidelines or {}
         )
-
-    def _get_import_symbols_from_agent(self, query: DataPoint) -> list[CodeSymbol]:
-        all_symbols = []
-        for app in [
+        self._max_workers = max_workers
+        self._candidate_apps: tuple[AppName, ...] = tuple(
             f"{APP_DOCS_ROOT}.{app}"
             for app in apps.module_names
             if app not in APP_DENY_LIST
-        ]:
-            messages = self._make_messages_for_primitives_selection(app, query)
-            completion = self._completer.complete(LLMPrompt(messages=messages))
+        )
+
+    def _get_import_symbols_from_agent(self, query: DataPoint) -> list[CodeSymbol]:
+        all_programs = []
+        # the selections for each app are independent, so all the prompts
+        # are submitted to the completer at once
+        completions = self._completer.complete_batch(
+            [
+                LLMPrompt(
+                    messages=self._make_messages_for_primitives_selection(app, query)
+                )
+                for app in self._candidate_apps
+            ],
+            max_workers=self._max_workers,
+        )
+        for app, completion in zip(self._candidate_apps, completions):
             try:
                 parsed = self._parser.parse(completion)
             except ProgramFinderError:
-                logger.warning(f"Query {query.query_id}: {query.query}")
+                logger.warning("Query %s: %s", query.query_id, query.query)
                 logger.warning(
-                    f"The completer did not output a valid output for app: {app}"
+                    "The completer did not output a valid output for app: %s", app
                 )
-                logger.warning(f"The completion was: {completion}")
+                logger.warning("The completion was: %s", completion)
                 parsed = ["None"]
-            for program in parsed:
-                all_symbols.extend(get_apps_symbols_from_program(program))
-        return dedup_and_sort_symbols(all_symbols)
+            all_programs.extend(parsed)
+        return dedup_and_sort_symbols(get_apps_symbols_from_programs(all_programs))
 
     def _make_messages_for_primitives_selection(
         self, app: AppName, query: DataPoint
     ) -> MessageList:
-        code = make_prompt_code_string(
-            app,
-            remove_import_statements(get_source_code_for_apps([app]).pop()),
-        )
+        code = _prompt_code_for_app(app)
         messages = [
             PrimitivesSelectionTemplate(
                 template_factory=self._primitives_selection_template
@@ -143,10 +167,14 @@ class PrimitivesSelectionAgent(BaseAgent):
         examples_code = "\n".join(code)
         examples_symbols = get_apps_symbols_from_program(examples_code)
 
-        symbols_for_scenario = symbols + examples_symbols
-        symbols_for_scenario.sort(key=lambda x: x.line_no)
-        scenario = deepcopy(annotation.scenario)
-        scenario.symbols_in_apps = symbols_for_scenario
+        # both lists are sorted by line number already
+        symbols_for_scenario = list(
+            heapq.merge(symbols, examples_symbols, key=attrgetter("line_no"))
+        )
+        # the prompt templates only read the scenario, so a shallow copy suffices
+        scenario = annotation.scenario.model_copy(
+            update={"symbols_in_apps": symbols_for_scenario}
+        )
 
         imports = get_imports(annotation.scenario, executable=True)
 
@@ -157,7 +185,7 @@ class PrimitivesSelectionAgent(BaseAgent):
             UserTurnTemplate(template_factory=self._user_template).get_prompt(
                 {
                     "queries": [query.query],
-                    "return_type": ExtractFunctionReturnType()(annotation.program),
+                    "return_type": _return_type(annotation.program),
                 }
             ),
         ]
@@ -179,6 +207,7 @@ class PrimitivesSelectionAgentUserTurn(PrimitivesSelectionAgent):
         primitives_selection_user: Callable[..., str],
         guidelines: dict[str, list[str]] | None = None,
         primitives_selection_guidelines: dict[str, list[str]] | None = None,
+        max_workers: int = 1,
         **kwargs,
     ):
         super().__init__(
@@ -187,6 +216,7 @@ class PrimitivesSelectionAgentUserTurn(PrimitivesSelectionAgent):
             completer,
             system=system,
             user=user,
+            max_workers=max_workers,
         )
         self._primitives_selection_template_system: Callable[..., str] = (
             primitives_selection_system
@@ -202,10 +232,7 @@ class PrimitivesSelectionAgentUserTurn(PrimitivesSelectionAgent):
     def _make_messages_for_primitives_selection(
         self, app: AppName, query: DataPoint
     ) -> MessageList:
-        code = make_prompt_code_string(
-            app,
-            remove_import_statements(get_source_code_for_apps([app]).pop()),
-        )
+        code = _prompt_code_for_app(app)
         messages = [
             PrimitivesSelectionTemplate(
                 template_factory=self._primitives_selection_template_system
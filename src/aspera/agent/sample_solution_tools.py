@@ -2,12 +2,13 @@
 # For licensing see accompanying LICENSE file.
 # Copyright © 2025 Apple Inc. All Rights Reserved.
 #
+import heapq
 import logging
-from copy import deepcopy
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Callable
 
-from aspera.agent.base_agent import BaseAgent
+from aspera.agent.base_agent import BaseAgent, _return_type
 from aspera.aliases import ExamplesModule
 from aspera.apps.time_utils import now_
 from aspera.code_utils.code_symbol import CodeSymbol
@@ -21,7 +22,7 @@ from aspera.completer import CompleterType
 from aspera.completer.utils import ChatMessage
 from aspera.constants import EXAMPLES_ROOT
 from aspera.dataset_schema import DataPoint
-from aspera.parser import ExtractFunctionReturnType, ParserType
+from aspera.parser import ParserType
 from aspera.prompting.system_turn_prompts import OracleSystemTurnTemplate
 from aspera.prompting.user_turn_prompts import UserTurnTemplate
 
@@ -80,10 +81,16 @@ class SampleSolutionToolsAgent(BaseAgent):
         )
         examples_symbols = get_apps_symbols_from_program(examples_code)
 
-        symbols_for_scenario = ground_truth_symbols + examples_symbols
-        symbols_for_scenario.sort(key=lambda x: x.line_no)
-        scenario = deepcopy(annotation.scenario)
-        scenario.symbols_in_apps = symbols_for_scenario
+        # both lists are sorted by line number already
+        symbols_for_scenario = list(
+            heapq.merge(
+                ground_truth_symbols, examples_symbols, key=attrgetter("line_no")
+            )
+        )
+        # the prompt templates only read the scenario, so a shallow copy suffices
+        scenario = annotation.scenario.model_copy(
+            update={"symbols_in_apps": symbols_for_scenario}
+        )
 
         imports = get_imports(annotation.scenario, executable=True)
 
@@ -94,7 +101,7 @@ class SampleSolutionToolsAgent(BaseAgent):
             UserTurnTemplate(template_factory=self._user_template).get_prompt(
                 {
                     "queries": [query.query],
-                    "return_type": ExtractFunctionReturnType()(annotation.program),
+                    "return_type": _return_type(annotation.program),
                 }
             ),
         ]
@@ -1,9 +1,25 @@
+import importlib
 import os
 import pkgutil
 
 package_dir = os.path.dirname(__file__)
 
-module_names = []
-for module_info in pkgutil.iter_modules([package_dir]):
-    module_names.append(module_info.name)
-    __import__(f"{__name__}.{module_info.name}")
+module_names = [module_info.name for module_info in pkgutil.iter_modules([package_dir])]
+
+
+def __getattr__(name: str):
+    # apps are imported on first access (PEP 562) rather than when the package is
+    # imported, since most callers only need a few of them
+    if name in module_names:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(module_names))
+
+
+def load_all() -> None:
+    """Import all the apps, for callers which inspect the whole package."""
+    for name in module_names:
+        importlib.import_module(f"{__name__}.{name}")
@@ -3,7 +3,7 @@
 # Copyright © 2025 Apple Inc. All Rights Reserved.
 #
 import datetime
-from copy import deepcopy
+import weakref as _weakref
 from enum import StrEnum, auto
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -32,6 +32,9 @@ if TYPE_CHECKING:
     from aspera.simulation.database_schemas import DatabaseNamespace
 
 EmployeeID = str
+# the directory columns needed to construct an `Employee`; only these are
+# converted to python objects when a search returns employees
+_EMPLOYEE_COLUMNS = ("name", "employee_id")
 
 
 class EmployeeDetails(BaseModel, frozen=True):
@@ -60,7 +63,7 @@ class EmployeeDetails(BaseModel, frozen=True):
     birth_date: datetime.date
     manager: Optional[EmployeeID]
     assistant: Optional[EmployeeID] = None
-    reports: list[EmployeeID] | None = None
+    reports: tuple[EmployeeID, ...] | None = None
     employee_id: str | None = None
     is_user: bool = False
 
@@ -95,6 +98,22 @@ class Employee(BaseModel, frozen=True):
         return data
 
 
+# `Employee` is immutable, so search results for the same person share one instance
+# while it is referenced, instead of validating a new model each time
+_EMPLOYEES: _weakref.WeakValueDictionary[tuple[str, EmployeeID], Employee] = (
+    _weakref.WeakValueDictionary()
+)
+
+
+def _employee(name: str, employee_id: EmployeeID) -> Employee:
+    key = (name, employee_id)
+    employee = _EMPLOYEES.get(key)
+    if employee is None:
+        employee = Employee(name=name, employee_id=employee_id)
+        _EMPLOYEES[key] = employee
+    return employee
+
+
 def get_employee_profile(employee: Employee) -> EmployeeDetails:
     """Return the profile of an employee, including details
     such as team name, mobile number, department, etc.
@@ -104,20 +123,25 @@ def get_employee_profile(employee: Employee) -> EmployeeDetails:
 
     context = get_current_context()
     assert employee.employee_id is not None
-    raw_records = filter_dataframe(
-        dataframe=context.get_database(
-            namespace=DatabaseNamespace.EMPLOYEES,
-        ),
-        filter_criteria=[
-            ("employee_id", employee.employee_id, exact_match_filter_dataframe),
-        ],
-    ).to_dicts()
-    # this should be unique because we are querying with a structured
-    # object returned by `find_employee`, which should unambiguously
-    # identify the individual
-    assert len(raw_records) == 1
-    record = deepcopy(raw_records[0])
-    return EmployeeDetails(**record)
+    # the records are cached until the directory changes; validation copies the
+    # record's values into a new model, so callers cannot modify the cached record
+    cache = context.get_cache(DatabaseNamespace.EMPLOYEES)
+    cache_key = ("profile", employee.employee_id)
+    if cache_key not in cache:
+        raw_records = filter_dataframe(
+            dataframe=context.get_database(
+                namespace=DatabaseNamespace.EMPLOYEES,
+            ),
+            filter_criteria=[
+                ("employee_id", employee.employee_id, exact_match_filter_dataframe),
+            ],
+        ).to_dicts()
+        # this should be unique because we are querying with a structured
+        # object returned by `find_employee`, which should unambiguously
+        # identify the individual
+        assert len(raw_records) == 1
+        cache[cache_key] = raw_records[0]
+    return EmployeeDetails(**cache[cache_key])
 
 
 def get_current_user() -> Employee:
@@ -126,19 +150,28 @@ def get_current_user() -> Employee:
     from aspera.simulation.execution_context import get_current_context
 
     context = get_current_context()
-    raw_records = filter_dataframe(
-        dataframe=context.get_database(
-            namespace=DatabaseNamespace.EMPLOYEES,
-        ),
-        filter_criteria=[("is_user", True, exact_match_filter_dataframe)],
-    ).to_dicts()
-    try:
-        assert len(raw_records) == 1
-    except AssertionError:
-        raise SearchError("Unable to retrieve user profile from the company directory.")
-    return Employee(
-        name=raw_records[0]["name"], employee_id=raw_records[0]["employee_id"]
-    )
+    # the user only changes if the directory does, so it is looked up once
+    cache = context.get_cache(DatabaseNamespace.EMPLOYEES)
+    if "current_user" not in cache:
+        raw_records = (
+            filter_dataframe(
+                dataframe=context.get_database(
+                    namespace=DatabaseNamespace.EMPLOYEES,
+                ),
+                filter_criteria=[("is_user", True, exact_match_filter_dataframe)],
+            )
+            .select(*_EMPLOYEE_COLUMNS)
+            .rows()
+        )
+        try:
+            assert len(raw_records) == 1
+        except AssertionError:
+            raise SearchError(
+                "Unable to retrieve user profile from the company directory."
+            )
+        cache["current_user"] = raw_records[0]
+    name, employee_id = cache["current_user"]
+    return _employee(name, employee_id)
 
 
 def find_employee(name: str) -> list[Employee]:
@@ -154,20 +187,28 @@ def find_employee(name: str) -> list[Employee]:
     from aspera.simulation.execution_context import get_current_context
 
     context = get_current_context()
-    raw_records = filter_dataframe(
-        dataframe=context.get_database(
-            namespace=DatabaseNamespace.EMPLOYEES,
-        ),
-        # a threshold of 90 is used to fuzzy match the names
-        filter_criteria=[
-            ("name", name, fuzzy_match_filter_dataframe),
-        ],
-    ).to_dicts()
-    if raw_records:
-        return [
-            Employee(name=r["name"], employee_id=r["employee_id"]) for r in raw_records
-        ]
-    return []
+    # programs often search for the same people several times, so the matches
+    # are cached until the directory changes
+    cache = context.get_cache(DatabaseNamespace.EMPLOYEES)
+    cache_key = ("find_employee", name)
+    if cache_key not in cache:
+        cache[cache_key] = (
+            filter_dataframe(
+                dataframe=context.get_database(
+                    namespace=DatabaseNamespace.EMPLOYEES,
+                ),
+                # a threshold of 90 is used to fuzzy match the names
+                filter_criteria=[
+                    ("name", name, fuzzy_match_filter_dataframe),
+                ],
+            )
+            .select(*_EMPLOYEE_COLUMNS)
+            .rows()
+        )
+    return [
+        _employee(employee_name, employee_id)
+        for employee_name, employee_id in cache[cache_key]
+    ]
 
 
 def find_team_of(employee: Employee) -> list[Employee]:
@@ -193,11 +234,11 @@ def find_team_of(employee: Employee) -> list[Employee]:
     raw_records = filter_dataframe(
         dataframe=context.get_database(namespace=DatabaseNamespace.EMPLOYEES),
         filter_criteria=[("team", team, exact_match_filter_dataframe)],
-    ).to_dicts()
+    ).select(*_EMPLOYEE_COLUMNS)
     team = [
-        Employee(name=r["name"], employee_id=r["employee_id"])
-        for r in raw_records
-        if r["employee_id"] != employee.employee_id
+        _employee(name, employee_id)
+        for name, employee_id in raw_records.iter_rows()
+        if employee_id != employee.employee_id
     ]
     team.sort(key=lambda x: x.name)
     return team
@@ -214,9 +255,12 @@ def find_reports_of(employee: Employee) -> list[Employee]:
     profile = get_employee_profile(employee)
     if profile.reports is None or not profile.reports:
         return []
+    # the directory index is fetched once for all the reports
+    names_by_id = _get_employee_names_by_id()
     reports = []
     for report_id in profile.reports:
-        reports.append(_get_employee_by_id(report_id))
+        assert report_id in names_by_id
+        reports.append(_employee(names_by_id[report_id], report_id))
     reports.sort(key=lambda x: x.name)
     return reports
 
@@ -269,15 +313,16 @@ def get_vacation_schedule(employee: Employee) -> list[TimeInterval] | None:
         filter_criteria=[
             ("employee_id", employee.employee_id, exact_match_filter_dataframe),
         ],
-    ).to_dicts()
+    )
     # employee ID not in DB => no hols booked
-    if not holiday_info:
+    if holiday_info.is_empty():
         return
-    schedule = []
-    for period in holiday_info:
-        schedule.append(TimeInterval(start=period["starts"], end=period["ends"]))
-    schedule.sort(key=lambda x: x.start)
-    return schedule
+    return [
+        TimeInterval(start=starts, end=ends)
+        for starts, ends in holiday_info.sort("starts", maintain_order=True)
+        .select("starts", "ends")
+        .iter_rows()
+    ]
 
 
 def get_all_employees() -> list[Employee]:
@@ -288,8 +333,10 @@ def get_all_employees() -> list[Employee]:
 
     context = get_current_context()
 
-    raw_db = context.get_database(namespace=DatabaseNamespace.EMPLOYEES).to_dicts()
-    company = [Employee(name=r["name"], employee_id=r["employee_id"]) for r in raw_db]
+    raw_db = context.get_database(namespace=DatabaseNamespace.EMPLOYEES).select(
+        *_EMPLOYEE_COLUMNS
+    )
+    company = [_employee(name, employee_id) for name, employee_id in raw_db.iter_rows()]
     company.sort(key=lambda x: x.name)
     return company
 
@@ -303,22 +350,31 @@ def _get_employee_by_id(employee_id: str) -> Employee:
     SearchError if `employee` is not in the database.
     """
 
+    names_by_id = _get_employee_names_by_id()
+    assert employee_id in names_by_id
+    return _employee(names_by_id[employee_id], employee_id)
+
+
+def _get_employee_names_by_id() -> dict[EmployeeID, str]:
+    """Map the IDs of the employees in the company directory to their names."""
+
     from aspera.simulation.database_schemas import DatabaseNamespace
     from aspera.simulation.execution_context import get_current_context
 
     current_context = get_current_context()
-    raw_records = filter_dataframe(
-        dataframe=current_context.get_database(namespace=DatabaseNamespace.EMPLOYEES),
-        filter_criteria=[
-            ("employee_id", employee_id, exact_match_filter_dataframe),
-        ],
-    ).to_dicts()
-    employees = [
-        Employee(name=record["name"], employee_id=record["employee_id"])
-        for record in raw_records
-    ]
-    assert len(employees) == 1
-    return employees[0]
+    # the IDs are unique, so the directory is indexed by ID once rather than
+    # scanned for each employee looked up
+    cache = current_context.get_cache(DatabaseNamespace.EMPLOYEES)
+    if "names_by_id" not in cache:
+        cache["names_by_id"] = {
+            employee_id: name
+            for name, employee_id in current_context.get_database(
+                namespace=DatabaseNamespace.EMPLOYEES
+            )
+            .select(*_EMPLOYEE_COLUMNS)
+            .iter_rows()
+        }
+    return cache["names_by_id"]
 
 
 def get_office_location(employee: Employee) -> str:
@@ -2,7 +2,10 @@
 # For licensing see accompanying LICENSE file.
 # Copyright © 2025 Apple Inc. All Rights Reserved.
 #
+import bisect as _bisect
 import datetime
+import itertools as _itertools
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import polars as pl
@@ -23,7 +26,13 @@ if TYPE_CHECKING:
     from aspera.simulation.database_schemas import DatabaseNamespace
 
 
-class ConferenceRoom(BaseModel):
+# the working day, used to check the availability on the dates passed to the searches
+_WORK_START = parse_time_string(TimeExpressions["StartOfWorkDay"])
+_WORK_END = parse_time_string(TimeExpressions["EndOfWorkDay"])
+
+
+@dataclass(slots=True)
+class ConferenceRoom:
     room_name: str
     capacity: int
 
@@ -54,16 +63,13 @@ def _maybe_convert_to_time_interval(
     #  make two separate calls to the tool if eg user query is along the lines
     #  "see if room X is available between 3 and 5 PM today or anytime tomorrow"
     if isinstance(time_window[0], datetime.date):
-        work_start = parse_time_string(TimeExpressions["StartOfWorkDay"])
-        work_end = parse_time_string(TimeExpressions["EndOfWorkDay"])
-        time_window = [
+        return [
             TimeInterval(
-                start=combine(d, work_start),
-                end=combine(d, work_end),
+                start=combine(d, _WORK_START),
+                end=combine(d, _WORK_END),
             )
             for d in time_window
         ]
-        return time_window
     return time_window
 
 
@@ -99,26 +105,66 @@ def find_available_time_slots(
         namespace=DatabaseNamespace.CONFERENCE_ROOMS
     )
     time_window = _maybe_convert_to_time_interval(time_window)
-    room = rooms_db.filter(
-        pl.col("room_name").str.contains(f"(?i){room_name}", strict=False)
-    ).select("room_id")
-    if room.is_empty():
-        raise SearchError(f"Room '{room_name}' not found")
-    room_id = room[0, "room_id"]
-    bookings = bookings_db.filter(pl.col("room_id") == room_id)
+    # the room is matched with a regex, so the lookups are cached until the
+    # rooms database changes
+    room_ids = context.get_cache(DatabaseNamespace.CONFERENCE_ROOMS)
+    if room_name not in room_ids:
+        room = rooms_db.filter(
+            pl.col("room_name").str.contains(f"(?i){room_name}", strict=False)
+        ).select("room_id")
+        if room.is_empty():
+            raise SearchError(f"Room '{room_name}' not found")
+        room_ids[room_name] = room[0, "room_id"]
+    room_id = room_ids[room_name]
+    bookings = _bookings_by_room(bookings_db.filter(pl.col("room_id") == room_id))
+    return _free_slots(bookings.get(room_id, []), time_window)
+
+
+def _bookings_by_room(
+    bookings_db: pl.DataFrame,
+) -> dict[str, list[tuple[datetime.datetime, datetime.datetime]]]:
+    """Read the (start, end) of the bookings in `bookings_db` for each room, sorted
+    by start."""
+    bookings = {}
+    for room_id, start, end in (
+        bookings_db.filter(pl.col("start").is_not_null() & pl.col("end").is_not_null())
+        .sort("start", maintain_order=True)
+        .select("room_id", "start", "end")
+        .iter_rows()
+    ):
+        bookings.setdefault(room_id, []).append((start, end))
+    return bookings
+
+
+def _free_slots(
+    bookings: list[tuple[datetime.datetime, datetime.datetime]],
+    time_window: list[TimeInterval],
+) -> list[TimeInterval]:
+    """Find when a room with the given `bookings`, sorted by start, is free in
+    `time_window`."""
+    booking_starts = [booking_start for booking_start, _ in bookings]
+    # the latest end of the bookings up to each position, which is non-decreasing
+    latest_booking_ends = list(
+        _itertools.accumulate((booking_end for _, booking_end in bookings), max)
+    )
     available_intervals = []
     for interval in time_window:
         start, end = interval.start, interval.end
-        overlapping_bookings = bookings.filter(
-            (pl.col("start") <= end) & (pl.col("end") >= start)
-        )
+        # the bookings that can overlap the interval start before it ends and come
+        # after all the bookings that are over by the time it starts
+        first = _bisect.bisect_left(latest_booking_ends, start)
+        last = _bisect.bisect_right(booking_starts, end)
+        overlapping_bookings = [
+            (booking_start, booking_end)
+            for booking_start, booking_end in bookings[first:last]
+            if booking_end >= start
+        ]
 
-        if overlapping_bookings.is_empty():
+        if not overlapping_bookings:
             available_intervals.append(interval)
         else:
             current_start = start
-            for booking in overlapping_bookings.iter_rows():
-                booking_start, booking_end = booking[2], booking[3]
+            for booking_start, booking_end in overlapping_bookings:
                 if current_start < booking_start:
                     available_intervals.append(
                         TimeInterval(current_start, booking_start)
@@ -135,9 +181,7 @@ def room_booking_default_time_window() -> TimeInterval:
     the end of the working day on the following Friday. Use for room search
     when the user does not specify the time interval (or intervals) they
     wish to book the room in."""
-    end = combine(
-        get_next_dow("Friday"), parse_time_string(TimeExpressions["EndOfWorkDay"])
-    )
+    end = combine(get_next_dow("Friday"), _WORK_END)
     return TimeInterval(start=now_(), end=end)
 
 
@@ -174,6 +218,9 @@ def search_conference_room(
     rooms_db: pl.DataFrame = context.get_database(
         namespace=DatabaseNamespace.CONFERENCE_ROOMS
     )
+    bookings_db: pl.DataFrame = context.get_database(
+        namespace=DatabaseNamespace.CONFERENCE_ROOM_BOOKINGS
+    )
     # filter the databases such that the rooms returned
     # have enough capacity
     if capacity is not None:
@@ -183,16 +230,20 @@ def search_conference_room(
         if len(rooms_db) == 0:
             return []
     time_constraints = _maybe_convert_to_time_interval(time_constraints)
+    # the bookings of all the rooms are read in one pass over the bookings database
+    bookings = _bookings_by_room(
+        bookings_db.filter(pl.col("room_id").is_in(rooms_db.get_column("room_id")))
+    )
     availability = []
-    for room in rooms_db.iter_rows():
-        room_name = room[2]
-        free_slots: list[TimeInterval] = find_available_time_slots(
-            room_name, time_constraints
-        )
+    for room_id, room_capacity, room_name in rooms_db.select(
+        "room_id", "capacity", "room_name"
+    ).iter_rows():
+        free_slots = _free_slots(bookings.get(room_id, []), time_constraints)
+        # the room and slots are read from the typed databases, so validation is skipped
         availability.append(
-            RoomAvailability(
+            RoomAvailability.model_construct(
                 free_slots=free_slots,
-                room=ConferenceRoom(room_name=room_name, capacity=room[1]),
+                room=ConferenceRoom(room_name=room_name, capacity=room_capacity),
             )
         )
     return availability
@@ -215,7 +266,7 @@ def summarise_availability(
     """
 
     if room_name is not None:
-        schedule = [entry for entry in schedule if entry[1].room_name == room_name]
+        schedule = [entry for entry in schedule if entry.room.room_name == room_name]
 
     if not schedule:
         return "No rooms found!"
@@ -224,13 +275,13 @@ def summarise_availability(
     #  will not include it.
     for result in schedule:
         room, free_slots = result.room, result.free_slots
-        room_summary = f"Room: {room.room_name} (Capacity: {room.capacity})\n"
-        for slot in free_slots:
-            start = slot.start.strftime("%Y-%m-%d %H:%M")
-            end = slot.end.strftime("%Y-%m-%d %H:%M")
-            room_summary += f"  Available: {start} to {end}\n"
+        room_summary = [f"Room: {room.room_name} (Capacity: {room.capacity})\n"]
+        room_summary.extend(
+            f"  Available: {slot.start:%Y-%m-%d %H:%M} to {slot.end:%Y-%m-%d %H:%M}\n"
+            for slot in free_slots
+        )
         if not free_slots:
-            room_summary += "   Fully booked!\n"
-        summaries.append(room_summary)
+            room_summary.append("   Fully booked!\n")
+        summaries.append("".join(room_summary))
 
     return "\n".join(summaries)
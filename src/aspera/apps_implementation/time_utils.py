@@ -6,7 +6,14 @@
 for parsing complex time strings into `datetime` objects, scheduling helpers and more.
 Always needed when time is involved in any shape or form."""
 
+# programs star-import this module, so helpers are imported under private names
+import calendar as _calendar
+import collections.abc as _abc
 import datetime
+import functools as _functools
+import itertools as _itertools
+import operator as _operator
+import typing as _typing
 from collections.abc import Generator
 from dataclasses import dataclass
 from enum import Enum, StrEnum, auto
@@ -61,10 +68,31 @@ Notes
 TimeUnits = Enum("TimeUnits", ["Hours", "Minutes", "Days", "Months"])
 """Enumerations used for parsing durations to specific time units"""
 
+# length of the fixed-size time units; months are variable and handled separately
+_SECONDS_PER_UNIT: dict[TimeUnits, int] = {
+    TimeUnits.Hours: 3600,
+    TimeUnits.Minutes: 60,
+    TimeUnits.Days: 86400,
+}
+_MINUTES_PER_UNIT: dict[TimeUnits, int] = {
+    unit: seconds // 60 for unit, seconds in _SECONDS_PER_UNIT.items()
+}
+
 weekdays = Literal[
     "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
 ]
 
+_WEEKDAY_ORDINALS: dict[str, int] = {
+    day: ordinal for ordinal, day in enumerate(_typing.get_args(weekdays))
+}
+
+
+def _weekday_ordinal(day_of_week: weekdays) -> int:
+    try:
+        return _WEEKDAY_ORDINALS[day_of_week]
+    except KeyError:
+        raise ValueError(f"Unknown day of the week: {day_of_week}")
+
 
 class Duration(NamedTuple):
     """A time unit, for representing event durations.
@@ -82,15 +110,11 @@ class Duration(NamedTuple):
 
     def to_minutes(self) -> float:
         """Convert the Duration to minutes."""
-        if self.unit == TimeUnits.Hours:
-            return float(self.number * 60)
-        elif self.unit == TimeUnits.Minutes:
-            return float(self.number)
-        elif self.unit == TimeUnits.Days:
-            return float(self.number * 24 * 60)
-        elif self.unit == TimeUnits.Months:
+        if self.unit == TimeUnits.Months:
             raise TypeError("Cannot convert variable durations to minutes!")
-        else:
+        try:
+            return float(self.number * _MINUTES_PER_UNIT[self.unit])
+        except KeyError:
             raise ValueError(f"Unsupported time unit: {self.unit}")
 
     def __le__(self, other: Self) -> bool:
@@ -110,19 +134,16 @@ class Duration(NamedTuple):
 
 
 def cast_to_timedelta(duration: Duration) -> datetime.timedelta:
-    if duration.unit == TimeUnits.Hours:
-        return datetime.timedelta(hours=duration.number)
-    elif duration.unit == TimeUnits.Minutes:
-        return datetime.timedelta(minutes=duration.number)
-    elif duration.unit == TimeUnits.Days:
-        return datetime.timedelta(days=duration.number)
-    elif duration.unit == TimeUnits.Months:
-        # Assuming 1 month = 30 days
+    if duration.unit == TimeUnits.Months:
         raise TypeError(
             "Cannot cast duration to timedelta for months: "
             "the number of days is variable."
         )
-    else:
+    try:
+        return datetime.timedelta(
+            seconds=duration.number * _SECONDS_PER_UNIT[duration.unit]
+        )
+    except KeyError:
         raise ValueError(f"Unsupported time unit: {duration.unit}")
 
 
@@ -148,14 +169,9 @@ class TimeInterval(NamedTuple):
 def convert(interval: TimeInterval, unit: TimeUnits) -> Duration:
     """Convert the duration of a time interval to a given time unit."""
     duration_in_seconds = (interval.end - interval.start).total_seconds()
-
-    if unit == TimeUnits.Hours:
-        number = duration_in_seconds / 3600
-    elif unit == TimeUnits.Minutes:
-        number = duration_in_seconds / 60
-    elif unit == TimeUnits.Days:
-        number = duration_in_seconds / 86400
-    else:
+    try:
+        number = duration_in_seconds / _SECONDS_PER_UNIT[unit]
+    except KeyError:
         raise ValueError(f"Unsupported time unit: {unit}")
 
     return Duration(number=number, unit=unit)
@@ -168,9 +184,13 @@ class DateRange(NamedTuple):
     end: datetime.date
 
 
+# the simulated device clock is fixed; datetimes are immutable so it is shared
+_NOW = datetime.datetime(year=2024, day=25, month=6, hour=9, minute=6)  # Tuesday
+
+
 def now_() -> datetime.datetime:
     """Return the current date and time on the user's device."""
-    return datetime.datetime(year=2024, day=25, month=6, hour=9, minute=6)  # Tuesday
+    return _NOW
 
 
 def get_weekday() -> weekdays:
@@ -181,9 +201,14 @@ def get_weekday() -> weekdays:
 def this_week_dates() -> list[datetime.date]:
     """The actual dates corresponding to days in the current week,
     including today and past days this week."""
+    return list(_this_week_dates())
+
+
+@_functools.lru_cache(maxsize=1)
+def _this_week_dates() -> tuple[datetime.date, ...]:
     today = now_().date()
-    start_of_week = today - datetime.timedelta(days=today.weekday())
-    return [start_of_week + datetime.timedelta(days=i) for i in range(7)]
+    start_of_week = today.toordinal() - today.weekday()
+    return tuple(datetime.date.fromordinal(start_of_week + i) for i in range(7))
 
 
 def get_weekday_ordinal() -> int:
@@ -192,37 +217,39 @@ def get_weekday_ordinal() -> int:
     return now_().weekday()
 
 
+_TIME_EXPRESSIONS: dict[TimeExpressions, datetime.time] = {
+    TimeExpressions.Afternoon: datetime.time(hour=14, minute=19),
+    TimeExpressions.Breakfast: datetime.time(hour=7, minute=23),
+    TimeExpressions.Brunch: datetime.time(hour=11, minute=1),
+    TimeExpressions.Dinner: datetime.time(hour=19, minute=29),
+    TimeExpressions.StartOfWorkDay: datetime.time(hour=9, minute=6),
+    TimeExpressions.EndOfWorkDay: datetime.time(hour=17, minute=10),
+    TimeExpressions.Evening: datetime.time(hour=19, minute=23),
+    TimeExpressions.Night: datetime.time(hour=22, minute=3),
+    TimeExpressions.LateAfternoon: datetime.time(hour=17, minute=1),
+    TimeExpressions.LateMorning: datetime.time(hour=10, minute=6),
+    TimeExpressions.Lunch: datetime.time(hour=12, minute=17),
+    TimeExpressions.Morning: datetime.time(hour=9, minute=5),
+    TimeExpressions.Noon: datetime.time(hour=12, minute=15),
+    TimeExpressions.Midnight: datetime.time(hour=0, minute=0),
+}
+
+
 def parse_time_string(time_expr: TimeExpressions) -> datetime.time:
     """Resolve a string representing a time of the day to a specific time
     on the user device."""
-    time_mappings = {
-        TimeExpressions.Afternoon: (14, 19),
-        TimeExpressions.Breakfast: (7, 23),
-        TimeExpressions.Brunch: (11, 1),
-        TimeExpressions.Dinner: (19, 29),
-        TimeExpressions.StartOfWorkDay: (9, 6),
-        TimeExpressions.EndOfWorkDay: (17, 10),
-        TimeExpressions.Evening: (19, 23),
-        TimeExpressions.Night: (22, 3),
-        TimeExpressions.LateAfternoon: (17, 1),
-        TimeExpressions.LateMorning: (10, 6),
-        TimeExpressions.Lunch: (12, 17),
-        TimeExpressions.Morning: (9, 5),
-        TimeExpressions.Noon: (12, 15),
-        TimeExpressions.Midnight: (0, 0),
-    }
     try:
-        hour, minute = time_mappings[time_expr]
+        return _TIME_EXPRESSIONS[time_expr]
     except KeyError:
         raise ParseError("Unknown time expression {}".format(time_expr))
-    return datetime.time(hour=hour, minute=minute)
 
 
 def time_by_hm(hour: int, minute: int, am_or_pm: str) -> datetime.time:
     """Create an object representing a specific time"""
-    if am_or_pm.lower() == "pm" and hour < 12:
+    am_or_pm = am_or_pm.lower()
+    if am_or_pm == "pm" and hour < 12:
         hour += 12
-    elif am_or_pm.lower() == "am" and hour == 12:
+    elif am_or_pm == "am" and hour == 12:
         hour = 0
     return datetime.time(hour, minute)
 
@@ -242,6 +269,7 @@ def date_by_mdy(
     return datetime.date(year=year, month=month, day=day)
 
 
+@_functools.lru_cache(maxsize=128)
 def get_next_dow(
     day_of_week: weekdays, after: datetime.date | None = None
 ) -> datetime.date:
@@ -256,21 +284,11 @@ def get_next_dow(
     today = now_().date()
     if after:
         today = after
-    weekdays = [
-        "Monday",
-        "Tuesday",
-        "Wednesday",
-        "Thursday",
-        "Friday",
-        "Saturday",
-        "Sunday",
-    ]
-    days_ahead = (list(weekdays).index(day_of_week) - today.weekday() + 7) % 7
-    if days_ahead == 0:
-        days_ahead = 7
+    days_ahead = (_weekday_ordinal(day_of_week) - today.weekday()) % 7 or 7
     return today + datetime.timedelta(days=days_ahead)
 
 
+@_functools.lru_cache(maxsize=128)
 def get_prev_dow(
     day_of_week: weekdays, before: datetime.date | None = None
 ) -> datetime.date:
@@ -286,23 +304,7 @@ def get_prev_dow(
     today = now_().date()
     if before:
         today = before
-
-    weekdays = [
-        "Monday",
-        "Tuesday",
-        "Wednesday",
-        "Thursday",
-        "Friday",
-        "Saturday",
-        "Sunday",
-    ]
-
-    day_index = weekdays.index(day_of_week)
-    days_ago = (today.weekday() - day_index + 7) % 7
-
-    if days_ago == 0:
-        days_ago = 7
-
+    days_ago = (today.weekday() - _weekday_ordinal(day_of_week)) % 7 or 7
     return today - datetime.timedelta(days=days_ago)
 
 
@@ -332,18 +334,26 @@ def parse_duration_to_calendar(
     3. A full calendar is returned for "ThisMonth" dates, including past dates. Appropriately
     filter the calendar when necessary for scheduling purposes.
     """
+    return [list(week) for week in _parse_duration_to_calendar(duration, after)]
+
+
+# the calendars only depend on the arguments and `now_()`, so they are built once
+@_functools.lru_cache(maxsize=256)
+def _parse_duration_to_calendar(
+    duration: Literal["NextWeek", "ThisMonth", "NextMonth"],
+    after: datetime.date | None = None,
+) -> tuple[tuple[datetime.date, ...], ...]:
     today = now_().date()
     if after:
         today = after
 
     def get_week_dates(start_date: datetime.date) -> list[datetime.date]:
-        return [start_date + datetime.timedelta(days=i) for i in range(7)]
-
-    calendar = []
+        start = start_date.toordinal()
+        return [datetime.date.fromordinal(start + i) for i in range(7)]
 
     if duration == "NextWeek":
         start_date = today + datetime.timedelta(days=(7 - today.weekday()))
-        return [get_week_dates(start_date)]
+        return (tuple(get_week_dates(start_date)),)
 
     elif duration == "ThisMonth":
         start_date = today.replace(day=1)
@@ -356,33 +366,23 @@ def parse_duration_to_calendar(
             month=start_date.month + 1, day=1
         ) - datetime.timedelta(days=1)
 
-    # Pad the first week
-    first_week = [
-        (
-            (start_date - datetime.timedelta(days=start_date.weekday() - i))
-            if i < start_date.weekday()
-            else (start_date + datetime.timedelta(days=i - start_date.weekday()))
-        )
-        for i in range(7)
-    ]
-
-    calendar.append(first_week)
+    # the calendar spans full weeks, from the Monday of the week of `start_date`
+    # to the Sunday of the week of `end_date`
+    first_monday = start_date.toordinal() - start_date.weekday()
+    num_weeks = (end_date.toordinal() - first_monday) // 7 + 1
+    return tuple(
+        tuple(get_week_dates(datetime.date.fromordinal(first_monday + 7 * week)))
+        for week in range(num_weeks)
+    )
 
-    current_date = first_week[-1] + datetime.timedelta(days=1)
-    while current_date <= end_date:
-        week = []
-        for i in range(7):
-            if current_date <= end_date:
-                week.append(current_date)
-                current_date += datetime.timedelta(days=1)
-            else:
-                week.append(current_date)
-                current_date += datetime.timedelta(days=1)
-        calendar.append(week)
 
-    return calendar
+def _month_bounds(year: int, month: int) -> tuple[datetime.date, datetime.date]:
+    """The first and last day of `month`."""
+    _, num_days = _calendar.monthrange(year, month)
+    return datetime.date(year, month, 1), datetime.date(year, month, num_days)
 
 
+@_functools.lru_cache(maxsize=256)
 def parse_durations_to_date_interval(
     expr: DateRanges, after: datetime.date | None = None
 ) -> DateRange:
@@ -408,23 +408,30 @@ def parse_durations_to_date_interval(
         start = today + datetime.timedelta(days=(7 - today.weekday()))
         end = start + datetime.timedelta(days=6)
     elif expr == DateRanges.ThisMonth:
-        start = today.replace(day=1)
-        end = start.replace(month=start.month + 1, day=1) - datetime.timedelta(days=1)
+        start, end = _month_bounds(today.year, today.month)
     elif expr == DateRanges.NextMonth:
-        start = (today.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
-        if start.month == 12:
-            end = start.replace(
-                year=start.year + 1, month=1, day=1
-            ) - datetime.timedelta(days=1)
-        else:
-            end = start.replace(month=start.month + 1, day=1) - datetime.timedelta(
-                days=1
-            )
+        start, end = _month_bounds(today.year + today.month // 12, today.month % 12 + 1)
     else:
         raise ParseError(f"Invalid date expression: {expr}")
     return DateRange(start=start, end=end)
 
 
+# each resolver maps today's date to the date the expression refers to
+_DATE_EXPRESSIONS: dict[
+    DateExpressions, _abc.Callable[[datetime.date], datetime.date]
+] = {
+    DateExpressions.Today: lambda today: today,
+    DateExpressions.Tomorrow: lambda today: today + datetime.timedelta(days=1),
+    DateExpressions.Yesterday: lambda today: today - datetime.timedelta(days=1),
+    DateExpressions.FirstDayNextYear: lambda today: datetime.date(today.year + 1, 1, 1),
+    DateExpressions.ChristmasDay: lambda today: datetime.date(today.year, 12, 25),
+    DateExpressions.LastMonth: lambda today: (
+        today.replace(day=1) - datetime.timedelta(days=1)
+    ),
+}
+
+
+@_functools.lru_cache(maxsize=128)
 def parse_date_string(date_expr: DateExpressions) -> datetime.date:
     """Resolve date expressions to `datetime`.
 
@@ -432,24 +439,21 @@ def parse_date_string(date_expr: DateExpressions) -> datetime.date:
     -----
     LastMonth is resolved to the last day of the previous month.
     """
-    today = now_().date()
-    date_mappings = {
-        DateExpressions.Today: today,
-        DateExpressions.Tomorrow: today + datetime.timedelta(days=1),
-        DateExpressions.Yesterday: today - datetime.timedelta(days=1),
-        DateExpressions.FirstDayNextYear: datetime.date(today.year + 1, 1, 1),
-        DateExpressions.ChristmasDay: datetime.date(today.year, 12, 25),
-        DateExpressions.LastMonth: (today.replace(day=1) - datetime.timedelta(days=1)),
-    }
     try:
-        return date_mappings[date_expr]
+        resolve = _DATE_EXPRESSIONS[date_expr]
     except KeyError:
         raise ParseError(f"Invalid date expression: {date_expr}")
+    return resolve(now_().date())
 
 
 DateTimeClauseOperators = Enum("DateTimeClauseOperators", ["add", "subtract"])
 """Operators for offsetting durations"""
 
+_CLAUSE_OPERATORS: dict[DateTimeClauseOperators, _abc.Callable] = {
+    DateTimeClauseOperators.add: _operator.add,
+    DateTimeClauseOperators.subtract: _operator.sub,
+}
+
 
 def sum_time_units(time_units: list[Duration]) -> Duration:
     """Sum the duration of all time units.
@@ -463,15 +467,8 @@ def sum_time_units(time_units: list[Duration]) -> Duration:
         will be summed to 2.16 hours, durations summing to 1440 minutes
         will be summed to 1 day etc.
     """
-    # Conversion factors to minutes
-    conversion_to_minutes = {
-        TimeUnits.Hours: 60,
-        TimeUnits.Minutes: 1,
-        TimeUnits.Days: 1440,  # 24 * 60
-    }
-
-    # Sum all durations in minutes
-    total_minutes = sum(t.number * conversion_to_minutes[t.unit] for t in time_units)
+    # Sum all durations in minutes, as a single scalar
+    total_minutes = sum(t.number * _MINUTES_PER_UNIT[t.unit] for t in time_units)
 
     # Choose the largest unit for the result
     if total_minutes >= 1440:
@@ -516,23 +513,16 @@ def modify(
 ) -> datetime.datetime:
     """Offset `datetime_to_change` by duration according to the given `operator`."""
 
-    if duration.unit == TimeUnits.Hours:
-        delta = datetime.timedelta(hours=duration.number)
-    elif duration.unit == TimeUnits.Minutes:
-        delta = datetime.timedelta(minutes=duration.number)
-    elif duration.unit == TimeUnits.Days:
-        delta = datetime.timedelta(days=duration.number)
-    elif duration.unit == TimeUnits.Months:
+    if duration.unit == TimeUnits.Months:
         delta = relativedelta(months=duration.number)
     else:
-        raise ValueError(f"Unsupported time unit: {duration.unit}")
+        delta = cast_to_timedelta(duration)
 
-    if operator == DateTimeClauseOperators.add:
-        return datetime_to_change + delta
-    elif operator == DateTimeClauseOperators.subtract:
-        return datetime_to_change - delta
-    else:
+    try:
+        apply = _CLAUSE_OPERATORS[operator]
+    except KeyError:
         raise ValueError(f"Unsupported operator: {operator}")
+    return apply(datetime_to_change, delta)
 
 
 def combine(date: datetime.date, time: datetime.time) -> datetime.datetime:
@@ -555,13 +545,9 @@ def intervals_overlap(
     overlap = (earliest_end - latest_start).total_seconds()
 
     # Convert min_duration to seconds
-    if min_duration.unit == TimeUnits.Hours:
-        min_overlap_seconds = min_duration.number * 3600
-    elif min_duration.unit == TimeUnits.Minutes:
-        min_overlap_seconds = min_duration.number * 60
-    elif min_duration.unit == TimeUnits.Days:
-        min_overlap_seconds = min_duration.number * 86400
-    else:
+    try:
+        min_overlap_seconds = min_duration.number * _SECONDS_PER_UNIT[min_duration.unit]
+    except KeyError:
         raise ValueError(f"Unsupported time unit: {min_duration.unit}")
     # Check if the overlap duration is at least the minimum duration
     return overlap >= min_overlap_seconds
@@ -596,7 +582,75 @@ class EventFrequency(StrEnum):
     YEARLY = auto()
 
 
-@dataclass
+_RRULE_FREQUENCIES: dict[EventFrequency, int] = {
+    EventFrequency.DAILY: rrule.DAILY,
+    EventFrequency.WEEKLY: rrule.WEEKLY,
+    EventFrequency.MONTHLY: rrule.MONTHLY,
+    EventFrequency.YEARLY: rrule.YEARLY,
+}
+
+
+@_functools.lru_cache(maxsize=1024)
+def _compile_rrule(
+    frequency: EventFrequency,
+    period: int,
+    dtstart: datetime.datetime,
+    until: datetime.datetime | None,
+    count: int | None,
+    byweekday: tuple[int, ...] | None,
+    bymonthday: tuple[int, ...] | None,
+    bymonth: tuple[int, ...] | None,
+    bysetpos: tuple[int, ...] | None,
+) -> rrule.rrule:
+    """Build the recurrence rule for the given (hashable) `RepetitionSpec` fields.
+
+    Notes
+    -----
+    The rule is shared between the specs with the same fields and start, so it caches
+    the occurrences it generates and repeated expansions do not recompute them.
+    """
+    rule_params = {
+        "freq": _RRULE_FREQUENCIES[frequency],
+        "interval": period,
+        "dtstart": dtstart,
+    }
+    optional_params = (
+        ("until", until),
+        ("count", count),
+        ("byweekday", byweekday),
+        ("bymonthday", bymonthday),
+        ("bymonth", bymonth),
+        ("bysetpos", bysetpos),
+    )
+    for name, value in optional_params:
+        if value is not None:
+            rule_params[name] = value
+    return rrule.rrule(cache=True, **rule_params)
+
+
+def _as_tuple(values: list[int] | None) -> tuple[int, ...] | None:
+    return tuple(values) if values is not None else None
+
+
+# recurrences at these frequencies are evenly spaced unless further constrained
+_FIXED_STEP_DAYS: dict[EventFrequency, int] = {
+    EventFrequency.DAILY: 1,
+    EventFrequency.WEEKLY: 7,
+}
+
+
+def _step_occurrences(
+    start: datetime.datetime, step_days: int, count: int | None
+) -> _abc.Iterator[datetime.datetime]:
+    """The occurrences of a recurrence which repeats every `step_days` days, as
+    expanded by `rrule` (which also drops the microseconds of the start)."""
+    start = start.replace(microsecond=0)
+    step = datetime.timedelta(days=step_days)
+    indices = range(count) if count is not None else _itertools.count()
+    return (start + i * step for i in indices)
+
+
+@dataclass(slots=True)
 class RepetitionSpec:
     """
     Represents a recurrence rule for defining recurring events.
@@ -651,6 +705,23 @@ class RepetitionSpec:
     def finite(self) -> bool:
         return any([self.max_repetitions is not None, self.recurs_until is not None])
 
+    @property
+    def _is_unconstrained(self) -> bool:
+        """Whether the occurrences are determined by the frequency, period and count
+        alone."""
+        return all(
+            field is None
+            for field in (
+                self.recurs_until,
+                self.which_weekday,
+                self.which_month_day,
+                self.which_year_month,
+                self.bysetpos,
+                self.exclude_occurrence,
+                self.occurrence_on_date,
+            )
+        )
+
     def generate_occurrences(
         self,
         start_date: datetime.date | None = None,
@@ -679,29 +750,33 @@ class RepetitionSpec:
 
         if not start_time:
             start_time = now_().time()
+        # the spec keeps the end of the series at the start time, since add_event
+        # stores it alongside the event
         if isinstance(self.recurs_until, datetime.date):
             self.recurs_until = datetime.datetime.combine(self.recurs_until, start_time)
         start_datetime = datetime.datetime.combine(start_date, start_time)
 
-        freq_map = {
-            EventFrequency.DAILY: rrule.DAILY,
-            EventFrequency.WEEKLY: rrule.WEEKLY,
-            EventFrequency.MONTHLY: rrule.MONTHLY,
-            EventFrequency.YEARLY: rrule.YEARLY,
-        }
-
-        rule_params = {
-            "freq": freq_map[self.frequency],
-            "interval": self.period,
-            "dtstart": start_datetime,
-            "until": self.recurs_until,
-            "count": self.max_repetitions,
-            "byweekday": self.which_weekday,
-            "bymonthday": self.which_month_day,
-            "bymonth": self.which_year_month,
-            "bysetpos": self.bysetpos,
-        }
-        rule = rrule.rrule(**{k: v for k, v in rule_params.items() if v is not None})
+        # plain daily and weekly series are simple enough to expand without rrule
+        step_days = _FIXED_STEP_DAYS.get(self.frequency)
+        if step_days is not None and self._is_unconstrained:
+            return _step_occurrences(
+                start_datetime, step_days * self.period, self.max_repetitions
+            )
+
+        rule = _compile_rrule(
+            self.frequency,
+            self.period,
+            start_datetime,
+            self.recurs_until,
+            self.max_repetitions,
+            _as_tuple(self.which_weekday),
+            _as_tuple(self.which_month_day),
+            _as_tuple(self.which_year_month),
+            _as_tuple(self.bysetpos),
+        )
+        # the rule set only adds overhead to each occurrence if nothing is excluded
+        if self.exclude_occurrence is None and self.occurrence_on_date is None:
+            return iter(rule)
         set_ = rruleset()
         set_.rrule(rule)
         if self.exclude_occurrence is not None:
@@ -710,7 +785,7 @@ class RepetitionSpec:
         if self.occurrence_on_date is not None:
             set_.exdate(self.occurrence_on_date)
 
-        return (occurrence for occurrence in set_)
+        return iter(set_)
 
 
 def _repetition_schedule(
@@ -4,6 +4,7 @@
 #
 """A powerful calendar app provided by the user's employer to help them get organised."""
 
+import collections.abc as _abc
 import datetime
 import functools
 import logging
@@ -160,33 +161,49 @@ class Event(BaseModel):
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        data = deepcopy(data)
+        return cls._from_record(deepcopy(data), _get_employee_by_id)
+
+    @classmethod
+    def from_dataframe(cls, dataframe: pl.DataFrame) -> list[Self]:
+        """Create the events stored in the rows of `dataframe`. Each attendee
+        is only looked up once, however many of the events they attend."""
+        get_employee = functools.cache(_get_employee_by_id)
+        return [
+            cls._from_record(record, get_employee) for record in dataframe.to_dicts()
+        ]
+
+    @classmethod
+    def _from_record(
+        cls, record: dict[str, Any], get_employee: _abc.Callable[[str], Employee]
+    ) -> Self:
+        """Create an event from a database `record`, which is modified in place."""
         for f in EMPLOYEE_FIELDS:
-            if (f_val := data[f]) is not None:
-                data[f] = [_get_employee_by_id(id_) for id_ in f_val]
+            if (f_val := record[f]) is not None:
+                record[f] = [get_employee(id_) for id_ in f_val]
         for f in STRUCT_FIELDS:
-            if data[f] is not None and all(val is None for val in data[f].values()):
-                data[f] = None
-        return cls(**data)
+            if record[f] is not None and all(val is None for val in record[f].values()):
+                record[f] = None
+        return cls(**record)
 
     def __eq__(self, other: Self) -> bool:
         """Override default equality test to ensure order or attendees fields
         does not matter in comparison."""
 
+        # the cheap comparisons run first, so that events which differ in eg
+        # their ID or start time are told apart without sorting attendees
         for f in self.model_fields:
+            if f not in EMPLOYEE_FIELDS and getattr(other, f) != getattr(self, f):
+                return False
+        for f in EMPLOYEE_FIELDS:
             self_f = getattr(self, f)
             other_f = getattr(other, f)
-            if f in EMPLOYEE_FIELDS:
-                if any(el is None for el in (self_f, other_f)):
-                    if self_f != other_f:
-                        return False
-                else:
-                    sort_self = sorted(self_f, key=lambda x: x.name)
-                    sort_other = sorted(other_f, key=lambda x: x.name)
-                    if sort_self != sort_other:
-                        return False
+            if any(el is None for el in (self_f, other_f)):
+                if self_f != other_f:
+                    return False
             else:
-                if other_f != self_f:
+                sort_self = sorted(self_f, key=lambda x: x.name)
+                sort_other = sorted(other_f, key=lambda x: x.name)
+                if sort_self != sort_other:
                     return False
         return True
 
@@ -269,17 +286,21 @@ def expand_to_instances(event: Event) -> list[Event] | None:
         start_date=event.starts_at.date(),
     )
     duration = event.ends_at - event.starts_at
-    instances = []
-    for instance_start_time in instance_start_times:
-        this_instance = deepcopy(event)
-        this_instance.event_id = str(uuid.uuid4())
-        this_instance.repeats = None
-        this_instance.starts_at = instance_start_time
-        this_instance.ends_at = instance_start_time + duration
-        this_instance.recurrent_event_id = event.event_id
-        this_instance.original_starts_at = event.starts_at
-        instances.append(this_instance)
-    return instances
+    # the instances are only serialised, so they can share the parent's
+    # attendees and attachments rather than copying them
+    return [
+        event.model_copy(
+            update={
+                "event_id": str(uuid.uuid4()),
+                "repeats": None,
+                "starts_at": instance_start_time,
+                "ends_at": instance_start_time + duration,
+                "recurrent_event_id": event.event_id,
+                "original_starts_at": event.starts_at,
+            }
+        )
+        for instance_start_time in instance_start_times
+    ]
 
 
 def add_event(event: Event) -> EventId:
@@ -341,25 +362,32 @@ def validate_starts_at(event):
         )
 
 
-def _find_event_helper(attendees: list[Employee] | None, subject: str | None):
+def _find_event_helper(
+    attendees: list[Employee] | None, subject: str | None, when: pl.Expr
+):
     """Helper function for finding both upcoming and past events in
-    the user calendar."""
+    the user calendar.
+
+    Parameters
+    ----------
+    when
+        A predicate on the event start times, which selects the upcoming or past events.
+    """
 
     from aspera.simulation.database_schemas import DatabaseNamespace
     from aspera.simulation.execution_context import get_current_context
 
     current_context = get_current_context()
+    calendar = current_context.get_database(namespace=DatabaseNamespace.USER_CALENDAR)
     # only the parent recurring events are returned
     filter_recurring_instances = [
         ("recurrent_event_id", None, exact_match_filter_dataframe),
     ]
     if all((attendees is None, subject is None)):
-        raw_records = filter_dataframe(
-            dataframe=current_context.get_database(
-                namespace=DatabaseNamespace.USER_CALENDAR,
-            ),
+        records = filter_dataframe(
+            dataframe=calendar,
             filter_criteria=filter_recurring_instances,
-        ).to_dicts()
+        )
     else:
         # the semantics of attendees = [] is events with
         # no attendees
@@ -368,10 +396,8 @@ def _find_event_helper(attendees: list[Employee] | None, subject: str | None):
         if attendees is not NOT_GIVEN:
             attendees = [a.employee_id for a in sorted(attendees, key=lambda x: x.name)]
         subject = subject or NOT_GIVEN
-        raw_records = filter_dataframe(
-            dataframe=current_context.get_database(
-                namespace=DatabaseNamespace.USER_CALENDAR
-            ),
+        records = filter_dataframe(
+            dataframe=calendar,
             filter_criteria=[
                 ("attendees", attendees, exact_match_filter_dataframe),
                 (
@@ -381,8 +407,10 @@ def _find_event_helper(attendees: list[Employee] | None, subject: str | None):
                 ),
             ]
             + filter_recurring_instances,
-        ).to_dicts()
-    events = [Event.from_dict(record) for record in raw_records]
+        )
+    # the subject match only keeps the best matches, so the events are filtered by
+    # time afterwards, like the recurring instances
+    events = Event.from_dataframe(records.filter(when))
     events.sort(key=lambda x: x.starts_at)
     return events
 
@@ -401,9 +429,8 @@ def find_events(
     # TODO: SHOULD RETURN EVENT EXCEPTIONS (IE RECURRING INSTANCES THAT HAVE BEEN CHANGED)
     """
 
-    events = _find_event_helper(attendees, subject)
     # NB: this also filters recurrences that have started in the past
-    return [e for e in events if e.starts_at >= now_()]
+    return _find_event_helper(attendees, subject, pl.col("starts_at") >= now_())
 
 
 def find_past_events(
@@ -412,8 +439,7 @@ def find_past_events(
     """Endpoint for finding events which have already occurred **in the user's calendar.**
     When called with no parameters, all the past events in the user's calendar are returned.
     """
-    events = _find_event_helper(attendees, subject)
-    return [e for e in events if e.starts_at < now_()]
+    return _find_event_helper(attendees, subject, pl.col("starts_at") < now_())
 
 
 def delete_event(event: Event):
@@ -460,8 +486,10 @@ def get_event_instances(event: Event) -> list[Event]:
     from aspera.simulation.database_schemas import DatabaseNamespace
     from aspera.simulation.execution_context import get_current_context
 
-    existing_event_ids = get_event_ids()
-    if event.event_id not in existing_event_ids:
+    current_context = get_current_context()
+    # the calendar is read once to check the event exists and to find its instances
+    calendar = current_context.get_database(namespace=DatabaseNamespace.USER_CALENDAR)
+    if event.event_id is None or not (calendar["event_id"] == event.event_id).any():
         raise SearchError(
             "The event you are looking for is not in the calendar. "
             "This function should only be called with existing events."
@@ -472,14 +500,11 @@ def get_event_instances(event: Event) -> list[Event]:
         parent_event_id,
         exact_match_filter_dataframe,
     )
-    current_context = get_current_context()
-    raw_records = filter_dataframe(
-        dataframe=current_context.get_database(
-            namespace=DatabaseNamespace.USER_CALENDAR
-        ),
+    records = filter_dataframe(
+        dataframe=calendar,
         filter_criteria=[recurring_instances_filter],
-    ).to_dicts()
-    events = [Event.from_dict(record) for record in raw_records]
+    )
+    events = Event.from_dataframe(records)
     events.sort(key=lambda x: x.starts_at)
     return events
 
@@ -495,19 +520,19 @@ def get_event_by_id(event_id: str) -> Event:
     from aspera.simulation.database_schemas import DatabaseNamespace
     from aspera.simulation.execution_context import get_current_context
 
-    event_ids = get_event_ids()
-    if event_id not in event_ids:
-        raise SearchError(f"No event with {event_id} was found in the calendar.")
     current_context = get_current_context()
-    raw_records = filter_dataframe(
+    records = filter_dataframe(
         dataframe=current_context.get_database(
             namespace=DatabaseNamespace.USER_CALENDAR
         ),
         filter_criteria=[
             ("event_id", event_id, exact_match_filter_dataframe),
         ],
-    ).to_dicts()
-    events = [Event.from_dict(record) for record in raw_records]
+    )
+    # the event exists iff the filter matches, so the IDs are not collected first
+    if records.is_empty():
+        raise SearchError(f"No event with {event_id} was found in the calendar.")
+    events = Event.from_dataframe(records)
     assert len(events) == 1
     return events[0]
 
@@ -662,6 +687,14 @@ def find_available_slots(
         return return_default_slots(date=date, search_settings=search_settings)
 
     events.sort(key=lambda e: e.starts_at or datetime.datetime.min)
+    # the events are bucketed by each date they span once, rather than the whole
+    # list being scanned for every day in the window
+    events_by_date: dict[datetime.date, list[tuple]] = {}
+    for e in events:
+        event_date, end_date = e.starts_at.date(), e.ends_at.date()
+        while event_date <= end_date:
+            events_by_date.setdefault(event_date, []).append((e.starts_at, e.ends_at))
+            event_date += datetime.timedelta(days=1)
     available_slots = []
 
     # Determine the available slots for each day in the availability window
@@ -670,12 +703,8 @@ def find_available_slots(
     ):
         if date is not None and day_start.date() != date:
             continue
-        daily_events = [
-            (e.starts_at, e.ends_at)
-            for e in events
-            if e.starts_at.date() <= day_start.date() <= e.ends_at.date()
-        ]
-        daily_events.sort()
+        # the events were sorted by start time before they were bucketed
+        daily_events = events_by_date.get(day_start.date(), [])
         # Process slots within the current day
         current_day_start = max(day_start, search_start)
         for event_start, event_end in daily_events:
@@ -706,15 +735,13 @@ def get_calendar(employee: Employee) -> list[Event]:
     all_shared_calendars = context.get_database(
         namespace=DatabaseNamespace.SHARED_CALENDARS
     )
-    raw_records = filter_dataframe(
+    records = filter_dataframe(
         dataframe=all_shared_calendars,
         filter_criteria=[
             ("calendar_id", employee.employee_id, exact_match_filter_dataframe),
         ],
-    ).to_dicts()
-    for r in raw_records:
-        r.pop("calendar_id")
-    events = [Event.from_dict(record) for record in raw_records]
+    ).drop("calendar_id")
+    events = Event.from_dataframe(records)
     return events
 
 
@@ -13,12 +13,12 @@ import textwrap
 from enum import EnumType
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Literal, get_args, get_origin
+from typing import Any, Iterable, Literal, get_args, get_origin
 
 import black
 
 from aspera import apps
-from aspera.aliases import AppName
+from aspera.aliases import AppName, EvaluationTool, SimulationTool
 from aspera.code_utils.code_symbol import CodeSymbol
 from aspera.constants import (
     APP_DOCS_ROOT,
@@ -37,12 +37,17 @@ logger = logging.getLogger(__name__)
 
 
 ASPERA_FILENAMES = [p.stem for p in Path(apps.__path__[0]).glob("*.py")]
+# matches if any of the filenames occurs in a string, in a single scan
+_ASPERA_FILENAMES_PATTERN = re.compile("|".join(map(re.escape, ASPERA_FILENAMES)))
 
 
 def _has_aspera_filenames(in_str: str) -> bool:
-    return any(fn in in_str for fn in ASPERA_FILENAMES)
+    if not ASPERA_FILENAMES:
+        return False
+    return _ASPERA_FILENAMES_PATTERN.search(in_str) is not None
 
 
+@functools.lru_cache(maxsize=1024)
 def remove_import_statements(
     source_code: str,
     package_name: str | None = PACKAGE_NAME,
@@ -70,7 +75,15 @@ def remove_import_statements(
     -------
     str
         The source code with specified import statements removed.
+
+    Notes
+    -----
+    The result only depends on the arguments, so it is memoised: the same
+    app sources and programs are stripped repeatedly when rendering prompts.
     """
+    if remove_aspera_imports_only:
+        # This is getting tricky for regex; switch to AST parse
+        return remove_aspera_imports(source_code)
     line_start = r"^" if global_only else r"^\s*"
     if package_name:
         import_pattern = re.compile(
@@ -111,26 +124,46 @@ def remove_import_statements(
             re.VERBOSE | re.MULTILINE,
         )
 
-    if remove_aspera_imports_only:
-        # This is getting tricky for regex; switch to AST parse
-        lines = source_code.splitlines()
-        to_remove = []
-        for node in ast.walk(ast.parse(source_code)):
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                if hasattr(node, "lineno") and hasattr(node, "end_lineno"):
-                    start, end = node.lineno, node.end_lineno
-                    code_segment = "\n".join(lines[start - 1 : end])
-                    spans = (start, end)
-                    if _has_aspera_filenames(code_segment) and spans not in to_remove:
-                        to_remove.append(spans)
-        if to_remove:
-            for start, end in reversed(sorted(to_remove)):
-                del lines[start - 1 : end]
-            cleaned_source = "\n".join(lines)
-        else:
-            cleaned_source = source_code
+    cleaned_source = re.sub(import_pattern, "", source_code)
+    cleaned_source = re.sub(r"\n{3,}", "\n\n", cleaned_source)
+    return cleaned_source.strip()
+
+
+def remove_aspera_imports(source_code: str, tree: ast.Module | None = None) -> str:
+    """
+    Remove the imports from `aspera` apps at any level of the given source code.
+
+    Parameters
+    ----------
+    source_code
+        The source code from which to remove import statements.
+    tree
+        The parsed `source_code`, if the caller has it already. The parse of
+        any string with the same lines as `source_code` can be used.
+
+    Returns
+    -------
+    str
+        The source code with the `aspera` import statements removed.
+    """
+    lines = source_code.splitlines()
+    if tree is None:
+        tree = ast.parse(source_code)
+    to_remove = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            if hasattr(node, "lineno") and hasattr(node, "end_lineno"):
+                start, end = node.lineno, node.end_lineno
+                code_segment = "\n".join(lines[start - 1 : end])
+                spans = (start, end)
+                if _has_aspera_filenames(code_segment) and spans not in to_remove:
+                    to_remove.append(spans)
+    if to_remove:
+        for start, end in reversed(sorted(to_remove)):
+            del lines[start - 1 : end]
+        cleaned_source = "\n".join(lines)
     else:
-        cleaned_source = re.sub(import_pattern, "", source_code)
+        cleaned_source = source_code
     cleaned_source = re.sub(r"\n{3,}", "\n\n", cleaned_source)
     return cleaned_source.strip()
 
@@ -186,8 +219,10 @@ def get_source_code_for_symbols_used_in_program(
 
     def _find_alias_definition(alias: Any) -> str | None:
         """These aren't linked to the module in the same way, so we need a bit extra to find them"""
-        for _, sys_module in list(sys.modules.items()):
-            if sys_module:
+        for module_name, sys_module in list(sys.modules.items()):
+            # only aspera sources are returned, and third-party lazy modules
+            # may fail to import their members when inspected
+            if sys_module and module_name.startswith(PACKAGE_NAME):
                 try:
                     for name, obj in inspect.getmembers(sys_module):
                         if obj is alias:
@@ -427,48 +462,101 @@ def get_imports(
 ) -> list[str]:
     """Returns imports relevant for `scenario`. These are displayed
     at the top of the staging file during data gen/annotation or
-    are imported inside the dynamically generated evaluation scripts."""
+    are imported inside the dynamically generated evaluation scripts.
+
+    Notes
+    -----
+    The imports only depend on the apps and tools of `scenario`, which are
+    shared by many queries, so they are memoised. A new list is returned on
+    each call, so callers may modify it.
+    """
+    return list(
+        _get_imports(
+            tuple(scenario.apps),
+            tuple(scenario.simulation_tools or ()) if import_simulation_tools else None,
+            tuple(scenario.evaluation_tools or ()) if import_testing_tools else None,
+            instructions=instructions,
+            executable=executable,
+            starred=starred,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _get_imports(
+    apps: tuple[AppName, ...],
+    simulation_tools: tuple[SimulationTool, ...] | None,
+    evaluation_tools: tuple[EvaluationTool, ...] | None,
+    *,
+    instructions: str | None,
+    executable: bool,
+    starred: bool,
+) -> tuple[str, ...]:
+    """The imports for a scenario with `apps`. The tools are `None` when they should
+    not be imported."""
+    scenario = Scenario(
+        apps=list(apps),
+        query_solution=[],
+        simulation_tools=None if simulation_tools is None else list(simulation_tools),
+        evaluation_tools=None if evaluation_tools is None else list(evaluation_tools),
+    )
     content = [] if instructions is None else [instructions, "\n\n"]
     content += create_apps_imports(scenario, executable=executable)
-    if import_simulation_tools:
+    if simulation_tools is not None:
         content += _create_imports(
             scenario,
             which_tools="runtime_setup",
             executable=executable,
             starred=starred,
         )
-    if import_testing_tools:
+    if evaluation_tools is not None:
         content += _create_imports(
             scenario, which_tools="evaluation", executable=executable, starred=starred
         )
     content.append("\n\n")
-    return content
+    return tuple(content)
 
 
+@functools.lru_cache(maxsize=1024)
 def is_import(text: str) -> bool:
     """Determines if a given text block is an import statement."""
     if not text:
         return False
     try:
-        tree = ast.parse(text.strip())
-        return all(isinstance(node, (ast.Import, ast.ImportFrom)) for node in tree.body)
+        return _is_import_tree(ast.parse(text.strip()))
     except SyntaxError:
         raise SyntaxError
 
 
+def _is_import_tree(tree: ast.Module) -> bool:
+    return all(isinstance(node, (ast.Import, ast.ImportFrom)) for node in tree.body)
+
+
 @functools.lru_cache
 def _get_all_aspera_symbols(
     module_name: str = APP_DOCS_ROOT,
     module: ModuleType = importlib.import_module(APP_DOCS_ROOT),
 ) -> list[CodeSymbol]:
+    def _is_apps_package_helper(obj: Any) -> bool:
+        """Whether `obj` is one of the helpers `aspera.apps` uses to load the apps,
+        rather than something the apps define."""
+        if inspect.ismodule(obj):
+            return not obj.__name__.startswith(PACKAGE_NAME)
+        return inspect.isfunction(obj) and obj.__module__ == apps.__name__
+
     def _list_symbols_in_module(module: ModuleType) -> list[CodeSymbol]:
         code_symbols = []
         for name, obj in inspect.getmembers(module):
+            if module is apps and _is_apps_package_helper(obj):
+                continue
             code_symbols.append(
                 CodeSymbol(obj_name=name, module_name=module.__name__, symbol_ref=obj)
             )
         return code_symbols
 
+    if module is apps:
+        # the apps are loaded lazily, make sure they are all visited
+        apps.load_all()
     all_code_symbols = _list_symbols_in_module(module)
     for name, obj in inspect.getmembers(module, inspect.ismodule):
         if obj.__name__.startswith(module_name):
@@ -490,7 +578,7 @@ def get_apps_symbols_from_program(program_str: str) -> list[CodeSymbol]:
 
     Returns
     ----------
-    list: List of fetched code symbols.
+    list: List of fetched code symbols, sorted by line number.
     """
 
     symbols_in_program = []
@@ -515,6 +603,24 @@ def get_apps_symbols_from_program(program_str: str) -> list[CodeSymbol]:
     return symbols_in_program
 
 
+def get_apps_symbols_from_programs(programs: Iterable[str]) -> list[CodeSymbol]:
+    """
+    Look for any `src/aspera/apps` function or class names in any of the given
+    strings, scanning the index of aspera symbols once for all of them.
+
+    Parameters
+    ----------
+    programs: String representations of Python programs.
+
+    Returns
+    ----------
+    list: List of fetched code symbols, sorted by line number.
+    """
+    # none of the formulations spans lines, so joining the programs does not
+    # introduce spurious matches
+    return get_apps_symbols_from_program("\n".join(programs))
+
+
 def get_imports_and_docstring_from_file(path: Path) -> str | None:
     """Get top-level import statements and docstring from the given file"""
     with open(path, "r") as f_in:
@@ -43,7 +43,6 @@ class AnthropicCompleter(Completer):
             raise RuntimeError(
                 f"Set ANTHROPIC_API_KEY env variable to use {self.__class__.__name__}"
             )
-        self._prompt_est_len = 0
         self._client = anthropic.Anthropic()
 
     def estimate_tokens(self, messages: list[MessageParam]) -> int:
@@ -76,16 +75,14 @@ class AnthropicCompleter(Completer):
         [system] = cast(
             MessageParam, [m for m in prompt.messages if m["role"] == "system"]
         )
-        self._prompt_est_len = self.estimate_tokens(
-            cast(list[MessageParam], prompt.messages)
-        )
+        prompt_est_len = self.estimate_tokens(cast(list[MessageParam], prompt.messages))
         messages = cast(
             list[MessageParam], [m for m in prompt.messages if m["role"] != "system"]
         )
         try:
             response = self._client.messages.create(
                 model=self._model_name,
-                max_tokens=self.max_tokens,
+                max_tokens=self._max_tokens_for(prompt_est_len),
                 system=system,
                 messages=messages,
                 temperature=self._temperature,
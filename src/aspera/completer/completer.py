@@ -3,7 +3,9 @@
 # Copyright © 2025 Apple Inc. All Rights Reserved.
 #
 import logging
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, cast
 
@@ -19,11 +21,19 @@ from aspera.completer.utils import (
 
 logger = logging.getLogger(__name__)
 
+# set to a non-empty value to disable the on-disk completion cache (eg for A/B runs)
+DISABLE_CACHE_ENV_VAR = "ASPERA_DISABLE_COMPLETION_CACHE"
+
 
 class CompletionCache:
     """
     A cache for completion results, that can be used by Completer implementations.
     Also implements retrying.
+
+    Completions are persisted in `cache_dir`, keyed by the serialised prompt, so
+    re-running the benchmark only queries the model for prompts that changed. The
+    cache is not used if `cache_dir` is `None` or the `ASPERA_DISABLE_COMPLETION_CACHE`
+    environment variable is set.
     """
 
     def __init__(self, cache_dir: Path | None):
@@ -33,6 +43,11 @@ class CompletionCache:
     def _make_cache(cache_dir: Path | None) -> Cache | None:
         if cache_dir is None:
             return None
+        if os.environ.get(DISABLE_CACHE_ENV_VAR):
+            logger.info(
+                "%s is set, completions will not be cached", DISABLE_CACHE_ENV_VAR
+            )
+            return None
         cache_dir.mkdir(exist_ok=True, parents=True)
         assert cache_dir.is_dir()
         return Cache(str(cache_dir))
@@ -46,18 +61,28 @@ class CompletionCache:
         timeout: float | None = None,
     ) -> str:
         """Use the given complete_fn, or return a cached completion."""
-        key = _make_cache_key(prompt)
-        if self._cache is not None and use_cache:
-            if key in self._cache:
-                logger.debug("Retrieving cached completion ... ")
-                return cast(str, self._cache[key])
+        if use_cache and (completion := self.lookup(prompt)) is not None:
+            return completion
 
         completion = complete_fn(prompt)
-        if self._cache is not None and completion is not None:
-            self._cache[key] = completion
-
+        self.store(prompt, completion)
         return completion
 
+    def lookup(self, prompt: LLMPrompt) -> str | None:
+        """Return the cached completion for `prompt`, if any."""
+        if self._cache is None:
+            return None
+        key = _make_cache_key(prompt)
+        if key in self._cache:
+            logger.debug("Retrieving cached completion ... ")
+            return cast(str, self._cache[key])
+        return None
+
+    def store(self, prompt: LLMPrompt, completion: str | None) -> None:
+        """Cache the `completion` of `prompt`."""
+        if self._cache is not None and completion is not None:
+            self._cache[_make_cache_key(prompt)] = completion
+
 
 class Completer(ABC):
     """Class that can be used to complete prompts."""
@@ -65,7 +90,6 @@ class Completer(ABC):
     def __init__(self, max_tokens: int = 100, model_name: str = ""):
         self._max_tokens = max_tokens
         self._model_name = model_name
-        self._prompt_est_len = 0
 
     _cache: CompletionCache
 
@@ -85,6 +109,36 @@ class Completer(ABC):
             timeout=timeout,
         )
 
+    def complete_batch(
+        self,
+        prompts: list[LLMPrompt],
+        use_cache: bool = True,
+        max_retries: int = 1,
+        timeout: float | None = None,
+        max_workers: int = 1,
+    ) -> list[str]:
+        """Complete several independent prompts, using the cache.
+
+        Completions are returned in the same order as `prompts`. Completers
+        whose backend supports batched inference should override this method.
+
+        Parameters
+        ----------
+        max_workers
+            If greater than 1, up to `max_workers` requests are sent to the
+            backend concurrently from a thread pool.
+        """
+
+        def _complete_one(prompt: LLMPrompt) -> str:
+            return self.complete(
+                prompt, use_cache=use_cache, max_retries=max_retries, timeout=timeout
+            )
+
+        if max_workers <= 1 or len(prompts) <= 1:
+            return [_complete_one(prompt) for prompt in prompts]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_complete_one, prompts))
+
     @abstractmethod
     def _complete(self, prompt: LLMPrompt) -> str:
         """Implementation of prompt completion, used by self.complete."""
@@ -97,22 +151,17 @@ class Completer(ABC):
         """Sets the completion response."""
         pass
 
-    @property
-    def max_tokens(self):
+    def _max_tokens_for(self, prompt_est_len: int) -> int:
+        """The completion length for a prompt with an estimated `prompt_est_len`
+        tokens. The estimate is passed in rather than stored on the completer,
+        since `complete_batch` may complete several prompts concurrently."""
         if self._max_tokens == -1:
-            remaining_tokens = (
-                MAX_CONTEXT_LENGTH[self._model_name] - self._prompt_est_len
-            )
+            remaining_tokens = MAX_CONTEXT_LENGTH[self._model_name] - prompt_est_len
             if remaining_tokens < WARN_COMPLETION_THRESHOLD:
                 logger.warning(f"Max completion length: {remaining_tokens}")
             return remaining_tokens
-        if (
-            self._prompt_est_len + self._max_tokens
-            > MAX_CONTEXT_LENGTH[self._model_name]
-        ):
-            remaining_tokens = (
-                MAX_CONTEXT_LENGTH[self._model_name] - self._prompt_est_len
-            )
+        if prompt_est_len + self._max_tokens > MAX_CONTEXT_LENGTH[self._model_name]:
+            remaining_tokens = MAX_CONTEXT_LENGTH[self._model_name] - prompt_est_len
             logger.warning(
                 f"Truncating max_tokens to {remaining_tokens} to avoid BadRequestError"
             )
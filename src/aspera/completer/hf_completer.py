@@ -25,6 +25,7 @@ class HuggingFaceCompleter(Completer):
         max_output_tokens: int = 4096,
         seed: int = 42,
         cache_dir: Path | None = DEFAULT_CACHE_DIR / "huggingface",
+        batch_size: int = 8,
     ):
         super().__init__(max_tokens=max_output_tokens, model_name=model_name)
         if "HUGGINGFACE_API_KEY" not in os.environ:
@@ -33,6 +34,7 @@ class HuggingFaceCompleter(Completer):
             )
         login(token=os.environ.get("HUGGINGFACE_API_KEY"))
         self._model_name = model_name
+        self._batch_size = batch_size
         self._chatbot = pipeline(
             "text-generation",
             model=model_name,
@@ -40,8 +42,18 @@ class HuggingFaceCompleter(Completer):
             torch_dtype=torch.bfloat16,
             # model_kwargs=quant_config,
         )
+        self._prepare_tokenizer_for_batching()
         self._cache = CompletionCache(self._full_cache_dir(cache_dir))
 
+    def _prepare_tokenizer_for_batching(self):
+        """Batched prompts are padded, but some tokenizers (e.g., Llama, Mistral)
+        have no padding token, so the end of sequence token is used instead.
+        Decoder-only models generate after the last token, so pad on the left."""
+        tokenizer = self._chatbot.tokenizer
+        tokenizer.padding_side = "left"
+        if tokenizer.pad_token is None:
+            tokenizer.pad_token = tokenizer.eos_token
+
     def _full_cache_dir(self, cache_dir: Path | None) -> Path | None:
         if cache_dir is None:
             return None
@@ -89,18 +101,65 @@ class HuggingFaceCompleter(Completer):
             add_generation_prompt=True,
         )
 
+    def complete_batch(
+        self,
+        prompts: list[LLMPrompt],
+        use_cache: bool = True,
+        max_retries: int = 1,
+        timeout: float | None = None,
+        max_workers: int = 1,
+    ) -> list[str]:
+        """Complete several independent prompts, using the cache.
+
+        The prompts which are not cached are run through the pipeline together, in
+        batches of `batch_size`. The pipeline runs locally, so `max_workers` is
+        ignored.
+        """
+        completions = [
+            self._cache.lookup(prompt) if use_cache else None for prompt in prompts
+        ]
+        uncached = [i for i, completion in enumerate(completions) if completion is None]
+        new_completions = self._complete_many([prompts[i] for i in uncached])
+        for i, completion in zip(uncached, new_completions):
+            self._cache.store(prompts[i], completion)
+            completions[i] = completion
+        return completions
+
     def _complete(self, prompt: LLMPrompt) -> str:
+        return self._complete_many([prompt])[0]
+
+    def _complete_many(self, prompts: list[LLMPrompt]) -> list[str]:
+        if not prompts:
+            return []
         # # Gemma does not support system role
         if "gemma" in self._model_name:
-            prompt = self._transform_prompt_for_gemma(prompt)
-            prompt_str = self._apply_chat_template(prompt)
-            output = self._chatbot(prompt.messages, max_new_tokens=self._max_tokens)
-            output_str = output[0]["generated_text"][-1]["content"]
+            prompts = [self._transform_prompt_for_gemma(prompt) for prompt in prompts]
+            prompt_strs = [self._apply_chat_template(prompt) for prompt in prompts]
+            outputs = self._generate([prompt.messages for prompt in prompts])
+            output_strs = [
+                output[0]["generated_text"][-1]["content"] for output in outputs
+            ]
         else:
-            prompt_str = "\n".join([message["content"] for message in prompt.messages])
-            output = self._chatbot(prompt_str, max_new_tokens=self._max_tokens)
-            output_str = output[0]["generated_text"][len(prompt_str) :]
-
-        logger.debug(f"------{self.model_name} prompt -----")
-        logger.debug(prompt_str)
-        return output_str
+            prompt_strs = [
+                "\n".join([message["content"] for message in prompt.messages])
+                for prompt in prompts
+            ]
+            outputs = self._generate(prompt_strs)
+            output_strs = [
+                output[0]["generated_text"][len(prompt_str) :]
+                for prompt_str, output in zip(prompt_strs, outputs)
+            ]
+
+        for prompt_str in prompt_strs:
+            logger.debug("------%s prompt -----", self.model_name)
+            logger.debug(prompt_str)
+        return output_strs
+
+    def _generate(self, inputs: list) -> list:
+        """Run `inputs` through the pipeline, returning one output per input. A single
+        input is not batched, so it needs no padding."""
+        if len(inputs) == 1:
+            return [self._chatbot(inputs[0], max_new_tokens=self._max_tokens)]
+        return self._chatbot(
+            inputs, max_new_tokens=self._max_tokens, batch_size=self._batch_size
+        )
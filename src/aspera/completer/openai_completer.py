@@ -4,6 +4,7 @@
 #
 import logging
 import os
+import threading
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, cast
@@ -90,6 +91,7 @@ class OpenAiChatCompleter(Completer):
             model_name, max_delay=max_delay
         )
         self._token_counter = TokenCounter(model=model_name)
+        self._token_counter_lock = threading.Lock()
         self._client = OpenAI()
         self._init_num_tokens(max_tokens)
         self._cache = CompletionCache(self._full_cache_dir(cache_dir))
@@ -118,7 +120,7 @@ class OpenAiChatCompleter(Completer):
                 m["role"] = "user"
         return prompt
 
-    def _call(self, prompt: LLMPrompt) -> ChatCompletion:
+    def _call(self, prompt: LLMPrompt, prompt_est_len: int) -> ChatCompletion:
 
         completer_kwargs = {
             "n": self._best_of_n,
@@ -140,7 +142,7 @@ class OpenAiChatCompleter(Completer):
             model=self._model_name,
             messages=prompt.messages,
             temperature=self._temperature,
-            max_tokens=self.max_tokens,
+            max_tokens=self._max_tokens_for(prompt_est_len),
             stop=prompt.stop_texts,
             **completer_kwargs,
         )  # type: ignore[no-untyped-call]
@@ -171,17 +173,18 @@ class OpenAiChatCompleter(Completer):
             num_prompt_tokens = num_tokens_from_messages(
                 prompt.messages, self._model_name
             )
-            self._prompt_est_len = num_prompt_tokens
             assert num_prompt_tokens is not None
             self._token_rate_limiter.consume(num_prompt_tokens)
-            response = self._call(prompt)
+            response = self._call(prompt, num_prompt_tokens)
             response = response.to_dict()
             num_completion_tokens = response.get("usage", {}).get(
                 "completion_tokens", 0
             )
             num_prompt_tokens = response.get("usage", {}).get("prompt_tokens", 0)
-            self._token_counter.increment_output_tokens(num_completion_tokens)
-            self._token_counter.increment_prompt(num_prompt_tokens)
+            # the counts are shared by the requests of a concurrent `complete_batch`
+            with self._token_counter_lock:
+                self._token_counter.increment_output_tokens(num_completion_tokens)
+                self._token_counter.increment_prompt(num_prompt_tokens)
             self._token_rate_limiter.consume(num_completion_tokens)
         except OpenAIError as e:
             raise CompletionApiError(f"OpenAIError: {e!r}")
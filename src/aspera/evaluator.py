@@ -2,6 +2,7 @@
 # For licensing see accompanying LICENSE file.
 # Copyright © 2025 Apple Inc. All Rights Reserved.
 #
+import functools
 import json
 import logging
 import textwrap
@@ -141,6 +142,26 @@ class PrimitivesSelectionResult(F1Score):
     ground_truth_symbol_names: set[str]
 
 
+def _read_annotation_records(plans_dir: Path) -> tuple[dict, ...]:
+    """The raw annotations in `plans_dir`, re-read only when its shards change. Each
+    `Evaluator` validates its own `DataPoint`s from these, because the agents mutate
+    them."""
+    shards_stats = []
+    for shard in sorted(plans_dir.glob(f"queries*.{QUERY_FILE_EXTENSION}")):
+        stat = shard.stat()
+        shards_stats.append((shard.name, stat.st_mtime_ns, stat.st_size))
+    return _read_annotation_shards(plans_dir, tuple(shards_stats))
+
+
+@functools.lru_cache(maxsize=8)
+def _read_annotation_shards(
+    plans_dir: Path, shards_stats: tuple[tuple[str, int, int], ...]
+) -> tuple[dict, ...]:
+    """Cached on the name, modification time and size of each shard in `plans_dir`,
+    so edited or added shards are picked up. Use `cache_clear` to drop the records."""
+    return tuple(read_all_shards_flat(plans_dir, extension=QUERY_FILE_EXTENSION))
+
+
 class Evaluator:
     """
     Parameters
@@ -154,13 +175,15 @@ class Evaluator:
         self._import_lenient_correct: dict[Query, bool] = {}
         self.corpus_dir = plans_dir
         annotations = [
-            DataPoint(**e)
-            for e in read_all_shards_flat(plans_dir, extension=QUERY_FILE_EXTENSION)
+            DataPoint(**e) for e in _read_annotation_records(Path(plans_dir))
         ]
         self._annotations: dict[str, DataPoint] = {
             example.query: example for example in annotations
         }
         self.total_queries = len(annotations)
+        self._sorted_annotations = sorted(
+            self._annotations.values(), key=lambda x: int(x.query_id)
+        )
         self.total_err_count = 0
         self.handback_control_err_count = 0
         environment = Environment()
@@ -181,7 +204,7 @@ class Evaluator:
 
     @property
     def annotations(self) -> list[DataPoint]:
-        return sorted(list(self._annotations.values()), key=lambda x: int(x.query_id))
+        return list(self._sorted_annotations)
 
     def get_score(self, import_lenient: bool = False) -> float:
         """Returns the score the agent achieved on the benchmark."""
@@ -246,6 +269,15 @@ class Evaluator:
         )
 
     def load_annotation(self, query: str) -> DataPoint:
+        """Return the annotation for `query`.
+
+        Notes
+        -----
+        1. All annotations are read from disk and validated once, when the
+        evaluator is created, so this is a dictionary lookup.
+        2. The same object is returned on every call, so changes made to it
+        (eg by the agents when rendering prompts) are visible to all callers.
+        """
         return self._annotations[query]
 
     def _get_eval_scripts(self, solution: Solution) -> list[str]:
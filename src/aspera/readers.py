@@ -13,6 +13,7 @@ from typing import Any, cast
 import nestedtext as nt
 from omegaconf import OmegaConf
 
+from aspera import register_config_resolvers
 from aspera.aliases import Query, QueryIdx, ShardPath
 from aspera.code_utils.utils import (
     remove_import_statements,
@@ -258,4 +259,5 @@ def query_loader(plans_dir: Path | str) -> list[str]:
     return list(index.keys())
 
 
+register_config_resolvers()
 OmegaConf.register_new_resolver("query_loader", query_loader)
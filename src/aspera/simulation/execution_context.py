@@ -6,7 +6,7 @@ import contextlib
 import copy
 import datetime
 from enum import StrEnum, auto
-from typing import Any, Iterator, Self, cast
+from typing import Any, Hashable, Iterator, Self, cast
 
 import polars as pl
 from polars.exceptions import NoDataError
@@ -67,6 +67,10 @@ class ExecutionContext:
         self.interactive_console = code.InteractiveConsole()
         # the query that is currently executed
         self.query = ""
+        # values derived from the databases by the apps, see `get_cache`
+        self._caches: dict[
+            DatabaseNamespace, tuple[pl.DataFrame, dict[Hashable, Any]]
+        ] = {}
 
     def to_dict(self) -> dict[str, Any]:
         """Serializes to a dictionary
@@ -197,6 +201,29 @@ class ExecutionContext:
             dataframe = self.drop_headguard(dataframe)
         return dataframe
 
+    def get_cache(self, namespace: DatabaseNamespace) -> dict[Hashable, Any]:
+        """Get a cache for values computed from a database (eg lookups by ID).
+
+        The cache is tied to the current state of the database: every update of
+        the database replaces the dataframe stored for `namespace`, so a new, empty
+        cache is returned after the database is modified.
+
+        Parameters
+        ----------
+        namespace:
+            Database namespace
+
+        Returns
+        -------
+            A dictionary which the caller can read and update.
+        """
+        database = self._dbs[namespace]
+        cached = self._caches.get(namespace)
+        if cached is None or cached[0] is not database:
+            cached = (database, {})
+            self._caches[namespace] = cached
+        return cached[1]
+
     def add_to_database(
         self,
         namespace: DatabaseNamespace,
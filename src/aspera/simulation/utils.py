@@ -150,9 +150,11 @@ def fuzzy_match_filter_dataframe(
     """
     threshold = kwargs.get("threshold", 90)
     # Find the indices of top scored rows, process.extract returns a tuple of (string, score, index)
+    # nb: the column is converted to a list in bulk rather than having rapidfuzz
+    #  iterate over the polars series
     matches = process.extract(
         query=value,
-        choices=dataframe.get_column(column_name),
+        choices=dataframe.get_column(column_name).to_list(),
         processor=utils.default_process,
         scorer=fuzz.WRatio,
         score_cutoff=threshold,
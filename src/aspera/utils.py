@@ -11,6 +11,8 @@ from typing import Generator
 
 from omegaconf import DictConfig, ListConfig, OmegaConf
 
+from aspera import register_config_resolvers
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,6 +77,7 @@ def snake_case(camel_str: str) -> str:
     return snake_str
 
 
+register_config_resolvers()
 OmegaConf.register_new_resolver("scenario_name", _scenario_name)
 OmegaConf.register_new_resolver(
     "create_dir", lambda pth, suffix=None: create_dir(pth, suffix)
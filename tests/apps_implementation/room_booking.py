@@ -11,6 +11,7 @@ from aspera.apps_implementation.exceptions import SearchError
 from aspera.apps_implementation.room_booking import (
     find_available_time_slots,
     search_conference_room,
+    summarise_availability,
 )
 from aspera.apps_implementation.time_utils import (
     TimeExpressions,
@@ -261,6 +262,18 @@ def test_search_conference_dates():
                 )
 
 
+def test_summarise_availability_for_one_room():
+    room_availability = search_conference_room(
+        time_constraints=[datetime.date(2024, 8, 10)],
+    )
+    summary = summarise_availability(room_availability, room_name="Beta Room")
+    assert summary.startswith("Room: Beta Room (Capacity: 20)")
+    assert "Alpha Room" not in summary
+    assert summarise_availability(room_availability, room_name="Gamma Room") == (
+        "No rooms found!"
+    )
+
+
 def test_find_available_time_slots_wrong_room_name():
 
     with pytest.raises(SearchError):
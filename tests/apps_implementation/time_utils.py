@@ -4,10 +4,15 @@
 #
 import datetime
 
+from dateutil import rrule
+
 from aspera.apps_implementation.time_utils import (
+    DateRange,
+    DateRanges,
     EventFrequency,
     RepetitionSpec,
     get_prev_dow,
+    parse_durations_to_date_interval,
 )
 
 
@@ -43,6 +48,44 @@ def test_daily_recurrence_with_exclusions():
     ), f"Expected {expected_dates}, but got {occurrences}"
 
 
+def test_recurrences_sharing_a_rule_keep_their_exclusions():
+    start_date = datetime.date(2024, 8, 1)
+    spec = dict(frequency=EventFrequency.DAILY, period=1, max_repetitions=3)
+    repetition = RepetitionSpec(**spec)
+    repetition_with_exclusions = RepetitionSpec(
+        **spec, exclude_occurrence=[create_test_datetime(2024, 8, 2)]
+    )
+
+    assert list(repetition.generate_occurrences(start_date=start_date)) == [
+        create_test_datetime(2024, 8, 1),
+        create_test_datetime(2024, 8, 2),
+        create_test_datetime(2024, 8, 3),
+    ]
+    assert list(
+        repetition_with_exclusions.generate_occurrences(start_date=start_date)
+    ) == [
+        create_test_datetime(2024, 8, 1),
+        create_test_datetime(2024, 8, 3),
+    ]
+    # the exclusions are not applied to the cached rule
+    assert len(list(repetition.generate_occurrences(start_date=start_date))) == 3
+
+
+def test_plain_recurrences_match_rrule():
+    start = datetime.datetime(2024, 8, 30, 9, 6)
+    for frequency, rrule_frequency in (
+        (EventFrequency.DAILY, rrule.DAILY),
+        (EventFrequency.WEEKLY, rrule.WEEKLY),
+    ):
+        repetition = RepetitionSpec(frequency=frequency, period=3, max_repetitions=6)
+        occurrences = repetition.generate_occurrences(
+            start_date=start.date(), start_time=start.time()
+        )
+        assert list(occurrences) == list(
+            rrule.rrule(rrule_frequency, interval=3, count=6, dtstart=start)
+        )
+
+
 def test_get_prev_dow():
     # Define some test cases
     test_cases = [
@@ -95,3 +138,20 @@ def test_get_prev_dow():
     assert get_prev_dow("Tuesday", before=datetime.date(2024, 6, 25)) == datetime.date(
         2024, 6, 18
     )  # Previous Tuesday
+
+
+def test_month_ranges_at_the_end_of_the_year():
+    december = datetime.date(2024, 12, 10)
+    assert parse_durations_to_date_interval(
+        DateRanges.ThisMonth, after=december
+    ) == DateRange(datetime.date(2024, 12, 1), datetime.date(2024, 12, 31))
+    assert parse_durations_to_date_interval(
+        DateRanges.NextMonth, after=december
+    ) == DateRange(datetime.date(2025, 1, 1), datetime.date(2025, 1, 31))
+
+
+def test_star_import_does_not_leak_helpers():
+    namespace = {}
+    exec("from aspera.apps_implementation.time_utils import *", namespace)
+    for name in ("add", "sub", "calendar", "functools", "itertools", "get_args"):
+        assert name not in namespace
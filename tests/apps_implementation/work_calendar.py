@@ -11,12 +11,19 @@ import pytest
 
 from aspera.apps_implementation.company_directory import Employee, find_employee
 from aspera.apps_implementation.exceptions import SearchError
-from aspera.apps_implementation.time_utils import EventFrequency, RepetitionSpec, now_
+from aspera.apps_implementation.time_utils import (
+    EventFrequency,
+    RepetitionSpec,
+    TimeInterval,
+    now_,
+)
 from aspera.apps_implementation.work_calendar import (
     DEFAULT_EVENT_DURATION_MINUTES,
+    CalendarSearchSettings,
     Event,
     add_event,
     delete_event,
+    find_available_slots,
     find_events,
     find_past_events,
     get_event_by_id,
@@ -282,6 +289,31 @@ def test_past_events(basic_event: Event):
     assert len(future_event) == 1
 
 
+def test_find_available_slots_around_overnight_event():
+    events = [
+        Event(
+            starts_at=datetime.datetime(2024, 9, 26, 10),
+            ends_at=datetime.datetime(2024, 9, 26, 11),
+        ),
+        Event(
+            starts_at=datetime.datetime(2024, 9, 26, 16),
+            ends_at=datetime.datetime(2024, 9, 27, 10),
+        ),
+    ]
+    settings = CalendarSearchSettings(datetime.time(9), datetime.time(17))
+    assert find_available_slots(events, search_settings=settings) == [
+        TimeInterval(
+            datetime.datetime(2024, 9, 26, 9), datetime.datetime(2024, 9, 26, 10)
+        ),
+        TimeInterval(
+            datetime.datetime(2024, 9, 26, 11), datetime.datetime(2024, 9, 26, 16)
+        ),
+        TimeInterval(
+            datetime.datetime(2024, 9, 27, 10), datetime.datetime(2024, 9, 27, 17)
+        ),
+    ]
+
+
 @pytest.fixture
 def sample_events(employees: dict[str, Employee]):
     """Fixture to create sample events for testing"""
@@ -93,3 +93,18 @@ def test_serialization_copying(populated_execution_context: ExecutionContext) ->
         assert deserialised._dbs[namespace].equals(
             populated_execution_context._dbs[namespace]
         )
+
+
+def test_cache_is_reset_when_database_changes(
+    populated_execution_context: ExecutionContext,
+) -> None:
+
+    cache = populated_execution_context.get_cache(DatabaseNamespace.EMPLOYEES)
+    cache["key"] = "value"
+    assert populated_execution_context.get_cache(DatabaseNamespace.EMPLOYEES) == {
+        "key": "value"
+    }
+    populated_execution_context.remove_from_database(
+        DatabaseNamespace.EMPLOYEES, pl.col("name") == "Alex"
+    )
+    assert populated_execution_context.get_cache(DatabaseNamespace.EMPLOYEES) == {}
@@ -11,6 +11,7 @@ from aspera.code_utils.utils import (
     escape_program_str,
     extract_import_statements,
     get_apps_symbols_from_program,
+    get_apps_symbols_from_programs,
     get_source_code_for_symbols_used_in_program,
     is_import,
     remove_import_statements,
@@ -179,6 +180,17 @@ def test_get_all_aspera_symbols_basic():
         assert symbol in all_aspera_symbols
 
 
+def test_get_all_aspera_symbols_skips_apps_package_helpers():
+    all_aspera_symbols = [s.import_path for s in _get_all_aspera_symbols()]
+    for symbol in [
+        "aspera.apps.__getattr__",
+        "aspera.apps.__dir__",
+        "aspera.apps.load_all",
+        "aspera.apps.importlib",
+    ]:
+        assert symbol not in all_aspera_symbols
+
+
 def test_get_all_aspera_symbols_preserves_order():
     all_aspera_symbols = [s.import_path for s in _get_all_aspera_symbols()]
     assert all_aspera_symbols.index(
@@ -214,6 +226,21 @@ def test_get_apps_symbols_from_program_1():
         assert s in symbol_names
 
 
+def test_get_apps_symbols_from_programs():
+    programs = [
+        "user = get_current_user()",
+        "team = find_team_of(user)",
+        "print(get_current_user)",
+    ]
+    expected = []
+    for program in programs:
+        expected += get_apps_symbols_from_program(program)
+    batched = get_apps_symbols_from_programs(programs)
+    assert {s.import_path for s in batched} == {s.import_path for s in expected}
+    # a symbol name split across programs is not matched
+    assert get_apps_symbols_from_programs(["find_team", "_of(user)"]) == []
+
+
 def test_get_apps_symbols_from_program_2():
     program = '''
        def schedule_weekly_meeting_with_engineering() -> list[datetime.date] | None:
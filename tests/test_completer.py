@@ -2,13 +2,15 @@
 # For licensing see accompanying LICENSE file.
 # Copyright © 2025 Apple Inc. All Rights Reserved.
 #
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 from vertexai.generative_models import Content, Part
 
 from aspera.completer import GeminiChatCompleter
-from aspera.completer.completer import DummyCompleter
+from aspera.completer.completer import Completer, CompletionCache, DummyCompleter
+from aspera.completer.hf_completer import HuggingFaceCompleter
 from aspera.completer.utils import ChatMessage, ChatRole, LLMPrompt, MessageList
 
 
@@ -20,3 +22,73 @@ def test_completer_simple():
     prompt = LLMPrompt(messages=MessageList([ChatMessage(role="foo", content="bar")]))
     completer = DummyCompleter()
     assert completer.complete(prompt)
+
+
+def test_completion_cache_lookup_and_store(tmp_path):
+    prompt = LLMPrompt(messages=MessageList([ChatMessage(role="foo", content="bar")]))
+    cache = CompletionCache(tmp_path)
+    assert cache.lookup(prompt) is None
+    cache.store(prompt, "hello world")
+    assert cache.lookup(prompt) == "hello world"
+
+
+class _LengthCompleter(Completer):
+    """Completes each prompt with its completion budget, once all the
+    prompts of a batch are in flight."""
+
+    def __init__(self, num_concurrent: int):
+        super().__init__(max_tokens=-1, model_name="gpt-4")
+        self._cache = CompletionCache(None)
+        self._in_flight = threading.Barrier(num_concurrent, timeout=10)
+
+    def _complete(self, prompt: LLMPrompt) -> str:
+        prompt_est_len = len(prompt.messages[0]["content"])
+        self._in_flight.wait()
+        return str(self._max_tokens_for(prompt_est_len))
+
+
+def test_complete_batch_concurrently():
+    contents = ["a" * n for n in (1, 20, 300, 4000)]
+    prompts = [
+        LLMPrompt(messages=MessageList([ChatMessage(role="user", content=content)]))
+        for content in contents
+    ]
+    completer = _LengthCompleter(num_concurrent=len(prompts))
+    completions = completer.complete_batch(prompts, max_workers=len(prompts))
+    assert completions == [str(8192 - len(content)) for content in contents]
+
+
+class _PipelineWithoutPadToken:
+    """Mimics a text-generation pipeline whose tokenizer has no padding token,
+    which the pipeline requires to batch inputs."""
+
+    def __init__(self):
+        self.tokenizer = Mock(pad_token=None, eos_token="</s>", padding_side="right")
+
+    def _generate(self, prompt: str) -> list[dict]:
+        return [{"generated_text": f"{prompt} done"}]
+
+    def __call__(self, inputs, max_new_tokens: int, batch_size: int = 1):
+        if isinstance(inputs, str):
+            return self._generate(inputs)
+        if batch_size > 1 and self.tokenizer.pad_token is None:
+            raise ValueError(
+                "Pipeline with tokenizer without pad_token cannot do batching"
+            )
+        return [self._generate(prompt) for prompt in inputs]
+
+
+@patch("aspera.completer.hf_completer.login", Mock())
+@patch("aspera.completer.hf_completer.pipeline")
+def test_hf_completer_without_pad_token(mock_pipeline, monkeypatch):
+    monkeypatch.setenv("HUGGINGFACE_API_KEY", "dummy")
+    mock_pipeline.return_value = _PipelineWithoutPadToken()
+    completer = HuggingFaceCompleter(model_name="mistralai/Mistral-7B", cache_dir=None)
+    prompts = [
+        LLMPrompt(messages=MessageList([ChatMessage(role="user", content=content)]))
+        for content in ("a", "b", "c")
+    ]
+    assert completer.complete(prompts[0]) == " done"
+    assert completer.complete_batch(prompts) == [" done"] * len(prompts)
+    assert mock_pipeline.return_value.tokenizer.pad_token == "</s>"
+    assert mock_pipeline.return_value.tokenizer.padding_side == "left"
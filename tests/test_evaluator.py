@@ -10,7 +10,7 @@ from typing import Iterator
 import pytest
 
 from aspera.code_utils.utils import get_imports
-from aspera.evaluator import Evaluator, Solution
+from aspera.evaluator import Evaluator, Solution, _read_annotation_records
 from aspera.execution_evaluation_tools_implementation.exceptions import SolutionError
 
 DATA_DIR = "asper_bench"
@@ -25,6 +25,14 @@ def evaluator(request, tmp_path_factory):
     return Evaluator(temp_dir)
 
 
+def test_annotation_records_follow_shard_changes(tmp_path):
+    shard = tmp_path / "queries_0.nt"
+    shard.write_text("-\n    query: first\n")
+    assert _read_annotation_records(tmp_path) == ({"query": "first"},)
+    shard.write_text("-\n    query: second, longer\n")
+    assert _read_annotation_records(tmp_path) == ({"query": "second, longer"},)
+
+
 def ground_truth_executables(evaluator: Evaluator) -> Iterator[Solution]:
     for query, annotation in evaluator._annotations.items():
         imports = get_imports(annotation.scenario, executable=True)